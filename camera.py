@@ -1,68 +1,171 @@
 import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 import numpy as np
+from numba import njit
 
-from hand_tracker import HandTracker, HandData
+from hand_tracker import HandTracker, HandData, NULL_HAND
 
 CAPTURE_W, CAPTURE_H = 80, 60
 
+# Hand-inference gating: skip MediaPipe while the scene is still, but
+# never coast longer than FORCE_DETECT_FRAMES frames. After
+# MISS_BACKOFF consecutive empty inferences on a still scene, the
+# forced re-check stretches by BACKOFF_FACTOR — the palm detector only
+# needs to hunt for a hand when motion suggests one might appear.
+MOTION_GATE = 0.01
+FORCE_DETECT_FRAMES = 15
+MISS_BACKOFF = 3
+BACKOFF_FACTOR = 4
+
+
+@njit(parallel=False, fastmath=True, nogil=True, cache=True)
+def compute_bm(gray, prev, bright_out, motion_out):
+    """Fused brightness + motion pass over one gray frame.
+
+    Reads the uint8 `gray`/`prev` buffers once, fills the preallocated
+    float32 `bright_out`/`motion_out` buffers, and returns the average
+    motion — replaces the separate astype/abs/mean passes (and covers
+    what a cv2.absdiff + cv2.mean pair would do, in a single sweep).
+    """
+    inv = 1.0 / 255.0
+    acc = 0.0
+    for i in range(gray.size):
+        g = np.float32(gray.flat[i])
+        p = np.float32(prev.flat[i])
+        bright_out.flat[i] = g * inv
+        d = abs(g - p) * inv
+        motion_out.flat[i] = d
+        acc += d
+    return acc / gray.size
+
 
 class Camera:
     def __init__(self, device=0):
         self._cap = cv2.VideoCapture(device, cv2.CAP_DSHOW)
         self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, 320)
         self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 240)
+        # Keep the driver buffer at one frame so read() always returns
+        # the freshest capture instead of a queued stale one
+        self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
         self._lock = threading.Lock()
-        self._brightness = np.zeros((CAPTURE_H, CAPTURE_W), dtype=np.float32)
-        self._motion = np.zeros((CAPTURE_H, CAPTURE_W), dtype=np.float32)
-        self._preview = np.zeros((CAPTURE_H * 2, CAPTURE_W * 2, 3), dtype=np.uint8)
+        # Two-slot ping-pong: the capture thread fills the write slot
+        # without the lock, then flips _read_idx under it. Consumers get
+        # direct references to the frozen slot (treat them as read-only).
+        self._buffers = [
+            (np.zeros((CAPTURE_H, CAPTURE_W), dtype=np.float32),
+             np.zeros((CAPTURE_H, CAPTURE_W), dtype=np.float32),
+             np.zeros((CAPTURE_H * 2, CAPTURE_W * 2, 3), dtype=np.uint8))
+            for _ in range(2)
+        ]
+        self._read_idx = 0
         self._avg_motion = 0.0
-        self._prev_gray = None
+        self._preview_seq = 0  # bumps per captured frame; consumers skip stale re-uploads
+        self._rgb_frame = None  # lazily sized to the capture resolution
+
+        # Reused OpenCV dst buffers — no per-frame resize/cvtColor allocs.
+        # _gray and _prev_gray swap roles each frame instead of reallocating.
+        self._small_bgr = np.empty((CAPTURE_H, CAPTURE_W, 3), dtype=np.uint8)
+        self._gray = np.empty((CAPTURE_H, CAPTURE_W), dtype=np.uint8)
+        self._prev_gray = np.empty((CAPTURE_H, CAPTURE_W), dtype=np.uint8)
+        self._have_prev = False
         self._running = True
 
         self._hand_tracker = HandTracker()
-        self._hand_data = HandData()
+        self._hand_data = NULL_HAND
         self._hand_ema = 0.0
 
+        # Runs MediaPipe inference concurrently with the (nogil) motion
+        # kernel so the numeric work hides under inference latency
+        self._hand_executor = ThreadPoolExecutor(max_workers=1)
+        self._last_avg_motion = 1.0  # force inference on the first frame
+        self._frames_since_inference = 0
+        self._inference_misses = 0
+
+        # Warm-start the JIT so the first real frame doesn't pay compile time
+        z = np.zeros((CAPTURE_H, CAPTURE_W), dtype=np.uint8)
+        compute_bm(z, z, self._buffers[0][0], self._buffers[0][1])
+
         self._thread = threading.Thread(target=self._capture_loop, daemon=True)
         self._thread.start()
 
     def _capture_loop(self):
+        hand_data = NULL_HAND
         while self._running:
             ok, frame = self._cap.read()
             if not ok:
                 continue
 
-            # Hand tracking on full 320x240 frame before resize
-            hand_data = self._hand_tracker.process(frame)
-
-            small = cv2.resize(frame, (CAPTURE_W, CAPTURE_H), interpolation=cv2.INTER_AREA)
-            gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
-            brightness = gray.astype(np.float32) / 255.0
-
-            if self._prev_gray is not None:
-                diff = np.abs(gray.astype(np.float32) - self._prev_gray.astype(np.float32)) / 255.0
+            # One BGR->RGB conversion shared by hand tracking and preview
+            if self._rgb_frame is None or self._rgb_frame.shape != frame.shape:
+                self._rgb_frame = np.empty_like(frame)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_frame)
+
+            # Motion gate: skip MediaPipe on still scenes (decided from
+            # the previous frame's motion so inference can still overlap
+            # the numeric pipeline below). Repeated empty inferences on a
+            # still scene back the forced re-check interval off further.
+            force_after = FORCE_DETECT_FRAMES
+            if self._inference_misses >= MISS_BACKOFF:
+                force_after *= BACKOFF_FACTOR
+            run_infer = (self._last_avg_motion >= MOTION_GATE
+                         or self._frames_since_inference >= force_after)
+
+            if run_infer:
+                # Hand tracking on full 320x240 frame before resize —
+                # kicked off async; the motion kernel runs while it infers
+                hand_future = self._hand_executor.submit(
+                    self._hand_tracker.process, self._rgb_frame, True)
+
+            cv2.resize(frame, (CAPTURE_W, CAPTURE_H),
+                       dst=self._small_bgr, interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(self._small_bgr, cv2.COLOR_BGR2GRAY, dst=self._gray)
+
+            # First frame: diff against itself so motion starts at zero
+            prev = self._prev_gray if self._have_prev else self._gray
+
+            # Fill the write slot outside the lock, then flip under it
+            brightness, motion, preview = self._buffers[1 - self._read_idx]
+            avg_m = float(compute_bm(self._gray, prev, brightness, motion))
+            cv2.resize(self._rgb_frame, (CAPTURE_W * 2, CAPTURE_H * 2),
+                       dst=preview, interpolation=cv2.INTER_NEAREST)
+
+            if run_infer:
+                hand_data = hand_future.result()
+                self._frames_since_inference = 0
+                if hand_data.detected or avg_m >= MOTION_GATE:
+                    self._inference_misses = 0
+                else:
+                    self._inference_misses += 1
             else:
-                diff = np.zeros_like(brightness)
-            self._prev_gray = gray
-
-            avg_m = float(np.mean(diff))
-
-            preview = cv2.resize(frame, (CAPTURE_W * 2, CAPTURE_H * 2), interpolation=cv2.INTER_AREA)
-            preview = cv2.cvtColor(preview, cv2.COLOR_BGR2RGB)
+                # Reuse the last result; decay confidence so a stale
+                # open palm releases rather than sticking forever
+                self._frames_since_inference += 1
+                if hasattr(self._hand_tracker, '_ema_confidence'):
+                    self._hand_tracker._ema_confidence *= 0.7
+            self._last_avg_motion = avg_m
 
             with self._lock:
-                self._brightness = brightness
-                self._motion = diff
+                self._read_idx ^= 1
+                self._preview_seq += 1
                 self._avg_motion = avg_m
-                self._preview = preview
                 self._hand_data = hand_data
                 self._hand_ema = getattr(self._hand_tracker, '_ema_confidence', 0.0)
 
+            self._gray, self._prev_gray = self._prev_gray, self._gray
+            self._have_prev = True
+
     def get_data(self):
+        """Return (brightness, motion, avg_motion) for the latest frame.
+
+        The arrays are references into the frozen read slot — consumers
+        must not mutate them.
+        """
         with self._lock:
-            return self._brightness.copy(), self._motion.copy(), self._avg_motion
+            brightness, motion, _ = self._buffers[self._read_idx]
+            return brightness, motion, self._avg_motion
 
     def get_hand_data(self) -> HandData:
         with self._lock:
@@ -73,11 +176,19 @@ class Camera:
             return self._hand_ema
 
     def get_preview(self):
+        """Return (seq, preview) for the 160x120 RGB preview.
+
+        The sequence number advances once per captured frame, so a
+        consumer drawing faster than the capture rate can skip
+        re-uploading an identical frame. The array is a read-only
+        reference into the frozen slot.
+        """
         with self._lock:
-            return self._preview.copy()
+            return self._preview_seq, self._buffers[self._read_idx][2]
 
     def stop(self):
         self._running = False
         self._thread.join(timeout=2.0)
+        self._hand_executor.shutdown(wait=False)
         self._hand_tracker.close()
         self._cap.release()
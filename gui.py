@@ -42,7 +42,8 @@ class GuiButton:
     """Clickable rectangle with hover/press states and tooltip."""
 
     def __init__(self, x, y, w, h, text, tooltip="", callback=None,
-                 toggle=False, group_value=None):
+                 toggle=False, group_value=None,
+                 batch=None, shape_group=None, text_group=None):
         self.x, self.y, self.w, self.h = x, y, w, h
         self.text = text
         self.tooltip = tooltip
@@ -56,13 +57,11 @@ class GuiButton:
         self.group_value = group_value  # used for radio groups
 
         # Shapes (batch-drawn)
-        self._bg = pyglet.shapes.Rectangle(x, y, w, h,
-                                           color=COL_BTN_BG[:3])
-        self._bg.opacity = COL_BTN_BG[3]
         self._border = pyglet.shapes.BorderedRectangle(
             x, y, w, h, border=2,
             color=COL_BTN_BG[:3],
             border_color=COL_BORDER[:3],
+            batch=batch, group=shape_group,
         )
         self._border.opacity = COL_BTN_BG[3]
 
@@ -71,8 +70,12 @@ class GuiButton:
             x=x + w // 2, y=y + h // 2,
             anchor_x="center", anchor_y="center",
             color=COL_TEXT,
+            batch=batch, group=text_group,
         )
 
+        # Last (pressed, hovered, active) styled — skips redundant writes
+        self._last_state = None
+
     def hit_test(self, mx, my):
         return _hit(mx, my, self.x, self.y, self.w, self.h)
 
@@ -87,7 +90,14 @@ class GuiButton:
     def on_release(self):
         self.pressed = False
 
-    def draw(self):
+    def update_style(self):
+        """Refresh batched shape/label colors for the current state."""
+        # Each shape setter re-uploads vertex colors — skip when idle
+        state = (self.pressed, self.hovered, self.active)
+        if state == self._last_state:
+            return
+        self._last_state = state
+
         # Decide colors
         if self.pressed:
             bg = COL_BTN_BG_PRESS
@@ -107,8 +117,6 @@ class GuiButton:
         self._border.color = bg[:3]
         self._border.opacity = bg[3]
         self._border.border_color = border_col
-        self._border.draw()
-        self._label.draw()
 
 
 # ═════════════════════════════════════════════════════════════
@@ -122,7 +130,8 @@ class GuiSlider:
     TRACK_H = 6
 
     def __init__(self, x, y, w, label_text, value=0.5,
-                 tooltip="", on_change=None):
+                 tooltip="", on_change=None,
+                 batch=None, shape_group=None, text_group=None):
         self.x, self.y, self.w = x, y, w
         self.h = 28                        # total hit-area height
         self.value = value
@@ -135,6 +144,7 @@ class GuiSlider:
             x, y + self.h // 2 - self.TRACK_H // 2,
             w, self.TRACK_H,
             color=COL_BORDER[:3],
+            batch=batch, group=shape_group,
         )
         self._track.opacity = 120
 
@@ -142,6 +152,7 @@ class GuiSlider:
             0, y + self.h // 2 - 10,
             self.KNOB_W, 20,
             color=COL_BORDER[:3],
+            batch=batch, group=shape_group,
         )
         self._knob.opacity = 255
 
@@ -150,14 +161,20 @@ class GuiSlider:
             x=x, y=y + self.h + 4,
             anchor_x="left", anchor_y="bottom",
             color=COL_TEXT,
+            batch=batch, group=text_group,
         )
         self._val_label = pyglet.text.Label(
             "", font_name="Consolas", font_size=11,
             x=x + w, y=y + self.h + 4,
             anchor_x="right", anchor_y="bottom",
             color=COL_TEXT,
+            batch=batch, group=text_group,
         )
 
+        # Last (hovered, dragging, value) styled — skips redundant writes
+        self._last_state = None
+        self._last_pct = -1  # last displayed integer percent
+
     def _knob_x(self):
         return self.x + int(self.value * (self.w - self.KNOB_W))
 
@@ -184,18 +201,24 @@ class GuiSlider:
         if self.on_change:
             self.on_change(self.value)
 
-    def draw(self):
-        self._track.draw()
-        kx = self._knob_x()
-        self._knob.x = kx
+    def update_style(self):
+        """Refresh batched knob position/color and percent readout."""
+        state = (self.hovered, self.dragging, self.value)
+        if state == self._last_state:
+            return
+        self._last_state = state
+
+        self._knob.x = self._knob_x()
         if self.hovered or self.dragging:
             self._knob.color = COL_BORDER_HOT[:3]
         else:
             self._knob.color = COL_BORDER[:3]
-        self._knob.draw()
-        self._title.draw()
-        self._val_label.text = f"{int(self.value * 100)}%"
-        self._val_label.draw()
+
+        # Label.text assignment re-runs glyph layout — only on % change
+        pct = int(self.value * 100)
+        if pct != self._last_pct:
+            self._val_label.text = f"{pct}%"
+            self._last_pct = pct
 
 
 # ═════════════════════════════════════════════════════════════
@@ -205,15 +228,14 @@ class GuiSlider:
 class GuiPanel:
     """Semi-transparent dark background container with a title."""
 
-    def __init__(self, x, y, w, h, title=""):
+    def __init__(self, x, y, w, h, title="",
+                 batch=None, shape_group=None, text_group=None):
         self.x, self.y, self.w, self.h = x, y, w, h
-        self._bg = pyglet.shapes.Rectangle(x, y, w, h,
-                                           color=COL_PANEL_BG[:3])
-        self._bg.opacity = COL_PANEL_BG[3]
         self._border = pyglet.shapes.BorderedRectangle(
             x, y, w, h, border=1,
             color=COL_PANEL_BG[:3],
             border_color=COL_BORDER[:3],
+            batch=batch, group=shape_group,
         )
         self._border.opacity = COL_PANEL_BG[3]
 
@@ -224,13 +246,9 @@ class GuiPanel:
                 x=x + 10, y=y + h - 8,
                 anchor_x="left", anchor_y="top",
                 color=COL_BORDER,
+                batch=batch, group=text_group,
             )
 
-    def draw(self):
-        self._border.draw()
-        if self._title:
-            self._title.draw()
-
 
 # ═════════════════════════════════════════════════════════════
 #  GameMenu  —  main orchestrator
@@ -267,10 +285,24 @@ class GameMenu:
 
         # Tooltip state
         self._tooltip_text = ""
+        self._last_tooltip = None  # last string written to the label
+
+        # One batch for every shape/label in the menu — a single GL draw
+        # call replaces the ~30 individual .draw() calls per frame.
+        # Groups enforce layering: dim < panels < widgets < text < tooltip.
+        self._batch = pyglet.graphics.Batch()
+        self._grp_dim = pyglet.graphics.Group(order=0)
+        self._grp_panel = pyglet.graphics.Group(order=1)
+        self._grp_widget = pyglet.graphics.Group(order=2)
+        self._grp_text = pyglet.graphics.Group(order=3)
+        self._grp_tooltip = pyglet.graphics.Group(order=4)
+        self._grp_tooltip_text = pyglet.graphics.Group(order=5)
 
         # Dim overlay behind menu
         self._dim = pyglet.shapes.Rectangle(0, 0, width, height,
-                                            color=(0, 0, 0))
+                                            color=(0, 0, 0),
+                                            batch=self._batch,
+                                            group=self._grp_dim)
         self._dim.opacity = 140
 
         # ── Layout ────────────────────────────────────────────
@@ -283,61 +315,68 @@ class GameMenu:
         gap = 14
         panel_pad = 32
 
+        # Batch/group kwargs shared by every widget / panel below
+        wkw = dict(batch=self._batch, shape_group=self._grp_widget,
+                   text_group=self._grp_text)
+        pkw = dict(batch=self._batch, shape_group=self._grp_panel,
+                   text_group=self._grp_text)
+
         # Title
         self._title_label = pyglet.text.Label(
             "~ SOUL STREAM ~", font_name="Georgia", font_size=22,
             x=width // 2, y=top + 10,
             anchor_x="center", anchor_y="center",
             color=COL_BORDER,
+            batch=self._batch, group=self._grp_text,
         )
 
         y = top - 30  # start below title
 
         # ── Source panel ──────────────────────────────────────
         src_h = row_h + panel_pad
-        self._source_panel = GuiPanel(px, y - src_h, panel_w, src_h, "Source")
+        self._source_panel = GuiPanel(px, y - src_h, panel_w, src_h, "Source", **pkw)
         btn_y = y - src_h + 10
         bw = (panel_w - 40) // 3
         self._btn_camera = GuiButton(
             px + 10, btn_y, bw, row_h, "Camera",
             tooltip="Toggle webcam input (key: C)",
             callback=callbacks["toggle_camera"],
-            toggle=True,
+            toggle=True, **wkw,
         )
         self._btn_prev = GuiButton(
             px + 15 + bw, btn_y, bw, row_h, "< Prev",
             tooltip="Previous image (key: Left Arrow)",
-            callback=callbacks["prev_image"],
+            callback=callbacks["prev_image"], **wkw,
         )
         self._btn_next = GuiButton(
             px + 20 + bw * 2, btn_y, bw, row_h, "Next >",
             tooltip="Next image (key: Right Arrow)",
-            callback=callbacks["next_image"],
+            callback=callbacks["next_image"], **wkw,
         )
         y -= src_h + gap
 
         # ── Mode panel ────────────────────────────────────────
         mode_h = row_h + panel_pad
-        self._mode_panel = GuiPanel(px, y - mode_h, panel_w, mode_h, "Mode")
+        self._mode_panel = GuiPanel(px, y - mode_h, panel_w, mode_h, "Mode", **pkw)
         btn_y = y - mode_h + 10
         bw3 = (panel_w - 40) // 3
         self._btn_auto = GuiButton(
             px + 10, btn_y, bw3, row_h, "Auto",
             tooltip="Automatic mode cycling (key: Space)",
             callback=callbacks["set_mode_auto"],
-            toggle=True, group_value=0,
+            toggle=True, group_value=0, **wkw,
         )
         self._btn_humanity = GuiButton(
             px + 15 + bw3, btn_y, bw3, row_h, "Humanity",
             tooltip="Force Humanity state — desaturated, slow drift",
             callback=callbacks["set_mode_humanity"],
-            toggle=True, group_value=1,
+            toggle=True, group_value=1, **wkw,
         )
         self._btn_ember = GuiButton(
             px + 20 + bw3 * 2, btn_y, bw3, row_h, "Ember",
             tooltip="Force Ember state — warm gold, fast rise",
             callback=callbacks["set_mode_ember"],
-            toggle=True, group_value=2,
+            toggle=True, group_value=2, **wkw,
         )
         self._mode_buttons = [self._btn_auto, self._btn_humanity, self._btn_ember]
         self._btn_auto.active = True  # default
@@ -345,31 +384,31 @@ class GameMenu:
 
         # ── Audio panel ───────────────────────────────────────
         audio_h = 60 + panel_pad
-        self._audio_panel = GuiPanel(px, y - audio_h, panel_w, audio_h, "Audio")
+        self._audio_panel = GuiPanel(px, y - audio_h, panel_w, audio_h, "Audio", **pkw)
         self._slider_vol = GuiSlider(
             px + 10, y - audio_h + 10, panel_w - 20,
             "Volume", value=0.25,
             tooltip="Adjust ambient background volume",
-            on_change=callbacks["set_volume"],
+            on_change=callbacks["set_volume"], **wkw,
         )
         y -= audio_h + gap
 
         # ── Tools panel ───────────────────────────────────────
         tools_h = row_h + panel_pad
-        self._tools_panel = GuiPanel(px, y - tools_h, panel_w, tools_h, "Tools")
+        self._tools_panel = GuiPanel(px, y - tools_h, panel_w, tools_h, "Tools", **pkw)
         btn_y = y - tools_h + 10
         bw2 = (panel_w - 30) // 2
         self._btn_debug = GuiButton(
             px + 10, btn_y, bw2, row_h, "Debug",
             tooltip="Toggle debug overlay with camera preview & stats (key: D)",
             callback=callbacks["toggle_debug"],
-            toggle=True,
+            toggle=True, **wkw,
         )
         self._btn_help = GuiButton(
             px + 20 + bw2, btn_y, bw2, row_h, "Help",
             tooltip="Show help panel with controls & lore (key: H)",
             callback=callbacks["toggle_help"],
-            toggle=True,
+            toggle=True, **wkw,
         )
         y -= tools_h + gap
 
@@ -378,7 +417,7 @@ class GameMenu:
         self._btn_quit = GuiButton(
             px + panel_w // 4, y - quit_h, panel_w // 2, quit_h, "Quit",
             tooltip="Thank you, Dark Souls. (key: Esc)",
-            callback=callbacks["quit"],
+            callback=callbacks["quit"], **wkw,
         )
         y -= quit_h + gap
 
@@ -386,13 +425,16 @@ class GameMenu:
         self._tooltip_bg = pyglet.shapes.Rectangle(
             px, y - 30, panel_w, 28,
             color=COL_TOOLTIP_BG[:3],
+            batch=self._batch, group=self._grp_tooltip,
         )
         self._tooltip_bg.opacity = COL_TOOLTIP_BG[3]
+        self._tooltip_bg.visible = False
         self._tooltip_label = pyglet.text.Label(
             "", font_name="Consolas", font_size=11, italic=True,
             x=width // 2, y=y - 16,
             anchor_x="center", anchor_y="center",
             color=(180, 170, 150, 200),
+            batch=self._batch, group=self._grp_tooltip_text,
         )
 
         # Collect all interactive elements for iteration
@@ -407,6 +449,14 @@ class GameMenu:
             self._audio_panel, self._tools_panel,
         ]
 
+        # Hit-test rows: widgets grouped by vertical band so mouse-motion
+        # only tests the row under the cursor instead of every widget
+        bands = {}
+        for w in (*self._buttons, self._slider_vol):
+            bands.setdefault((w.y, w.y + w.h), []).append(w)
+        self._rows = sorted((y0, y1, ws) for (y0, y1), ws in bands.items())
+        self._hover_row = None
+
     # ── public sync helpers ───────────────────────────────────
 
     def sync_state(self, *, use_camera=False, mode=0,
@@ -427,15 +477,30 @@ class GameMenu:
     def on_mouse_motion(self, mx, my):
         if not self.visible:
             return
-        self._tooltip_text = ""
-        for btn in self._buttons:
-            inside = btn.hit_test(mx, my)
-            btn.on_hover(inside)
-            if inside and btn.tooltip:
-                self._tooltip_text = btn.tooltip
-        self._slider_vol.on_hover(self._slider_vol.hit_test(mx, my))
-        if self._slider_vol.hovered and self._slider_vol.tooltip:
-            self._tooltip_text = self._slider_vol.tooltip
+
+        # Find the vertical band under the cursor (a handful of rows)
+        row = None
+        for r in self._rows:
+            if r[0] <= my <= r[1]:
+                row = r
+                break
+
+        # Un-hover the previous row only when the cursor left it
+        if self._hover_row is not None and self._hover_row is not row:
+            for w in self._hover_row[2]:
+                if w.hovered:
+                    w.on_hover(False)
+        self._hover_row = row
+
+        tooltip = ""
+        if row is not None:
+            for w in row[2]:
+                inside = w.hit_test(mx, my)
+                if inside != w.hovered:
+                    w.on_hover(inside)
+                if inside and w.tooltip:
+                    tooltip = w.tooltip
+        self._tooltip_text = tooltip
 
     def on_mouse_press(self, mx, my, button):
         """Returns True if the click was consumed by the menu."""
@@ -476,25 +541,15 @@ class GameMenu:
         if not self.visible:
             return
 
-        # Dim background
-        self._dim.draw()
-
-        # Title
-        self._title_label.draw()
-
-        # Panels
-        for panel in self._panels:
-            panel.draw()
-
-        # Buttons
+        # Refresh dynamic widget state, then one batched draw call
         for btn in self._buttons:
-            btn.draw()
+            btn.update_style()
+        self._slider_vol.update_style()
 
-        # Slider
-        self._slider_vol.draw()
-
-        # Tooltip
-        if self._tooltip_text:
-            self._tooltip_bg.draw()
+        # Tooltip — rewriting Label.text relayouts glyphs, so only on change
+        if self._tooltip_text != self._last_tooltip:
+            self._tooltip_bg.visible = bool(self._tooltip_text)
             self._tooltip_label.text = self._tooltip_text
-            self._tooltip_label.draw()
+            self._last_tooltip = self._tooltip_text
+
+        self._batch.draw()
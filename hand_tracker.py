@@ -1,8 +1,15 @@
 import os
 from dataclasses import dataclass
 
+import cv2
+import numpy as np
+
 MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hand_landmarker.task")
 
+# Landmark indices for the four non-thumb fingertips and their MCP joints
+FINGER_TIPS = np.array([8, 12, 16, 20])
+FINGER_MCPS = np.array([5, 9, 13, 17])
+
 
 @dataclass
 class HandData:
@@ -10,9 +17,19 @@ class HandData:
     is_open_palm: bool = False
     palm_ndc_x: float = 0.0
     palm_ndc_y: float = 0.0
-    landmarks: list = None  # 21 (ndc_x, ndc_y) tuples when detected
-    # Debug: per-finger extension state
-    finger_states: dict = None
+    landmarks: object = None  # (21, 2) float32 ndarray of NDC coords when detected
+    # Debug: per-finger extension bitmask (bit 0=thumb .. bit 4=pinky)
+    finger_states: int = 0
+
+    def finger_state(self, idx):
+        """True if finger `idx` (0=thumb, 1=index, .., 4=pinky) is extended."""
+        return bool((self.finger_states >> idx) & 1)
+
+
+# Shared not-detected sentinel — consumers only read HandData, so the
+# no-hand frames (the common case) reuse one instance instead of
+# allocating a fresh dataclass every frame. Never mutate it.
+NULL_HAND = HandData()
 
 
 try:
@@ -37,10 +54,10 @@ try:
             self._ema_confidence = 0.0
             self._frame_ts_ms = 0
 
-        def process(self, frame_bgr) -> HandData:
-            import cv2
-
-            frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
+        def process(self, frame, already_rgb=False) -> HandData:
+            # Callers that already hold an RGB frame (camera.py shares one
+            # with its preview path) can skip the second cvtColor
+            frame_rgb = frame if already_rgb else cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame_rgb)
 
             self._frame_ts_ms += 33  # ~30fps increment
@@ -48,48 +65,44 @@ try:
 
             if not result.hand_landmarks:
                 self._ema_confidence = self._ema_confidence * 0.7
-                return HandData(detected=False)
+                return NULL_HAND
 
             lm = result.hand_landmarks[0]  # list of 21 NormalizedLandmark
 
+            # Pull all 21 (x, y) pairs into one float32 array up front
+            arr = np.fromiter((v for l in lm for v in (l.x, l.y)),
+                              dtype=np.float32, count=42).reshape(21, 2)
+
             # Open palm detection: all 5 fingers extended
             # Fingers: tip y < mcp y (image coords, lower y = higher on screen)
-            finger_states = {}
-
-            fingers_extended = (
-                lm[8].y < lm[5].y    # Index: tip(8) above MCP(5)
-                and lm[12].y < lm[9].y   # Middle: tip(12) above MCP(9)
-                and lm[16].y < lm[13].y  # Ring: tip(16) above MCP(13)
-                and lm[20].y < lm[17].y  # Pinky: tip(20) above MCP(17)
-            )
-
-            finger_states["index"] = lm[8].y < lm[5].y
-            finger_states["middle"] = lm[12].y < lm[9].y
-            finger_states["ring"] = lm[16].y < lm[13].y
-            finger_states["pinky"] = lm[20].y < lm[17].y
+            ext = arr[FINGER_TIPS, 1] < arr[FINGER_MCPS, 1]
+            fingers_extended = bool(ext.all())
 
             # Thumb: tip(4) x-distance from wrist(0) > MCP(2) x-distance from wrist
-            thumb_tip_dist = abs(lm[4].x - lm[0].x)
-            thumb_mcp_dist = abs(lm[2].x - lm[0].x)
-            thumb_extended = thumb_tip_dist > thumb_mcp_dist
-            finger_states["thumb"] = thumb_extended
+            thumb_extended = bool(abs(arr[4, 0] - arr[0, 0]) > abs(arr[2, 0] - arr[0, 0]))
+
+            # Pack into a 5-bit mask (bit 0=thumb .. bit 4=pinky) — no
+            # per-frame dict / boxed bool allocations
+            finger_mask = (int(thumb_extended)
+                           | int(ext[0]) << 1
+                           | int(ext[1]) << 2
+                           | int(ext[2]) << 3
+                           | int(ext[3]) << 4)
 
             raw = 1.0 if (fingers_extended and thumb_extended) else 0.0
             self._ema_confidence = self._ema_confidence * 0.7 + raw * 0.3
             is_open = self._ema_confidence > 0.5
 
-            # Palm center: average of WRIST(0) and MIDDLE_MCP(9)
-            cx = (lm[0].x + lm[9].x) / 2.0
-            cy = (lm[0].y + lm[9].y) / 2.0
-
-            # NDC conversion matching camera.py mirrored convention
-            palm_ndc_x = 1.0 - cx * 2.0
-            palm_ndc_y = 1.0 - cy * 2.0
+            # NDC conversion matching camera.py mirrored convention —
+            # one in-place affine over all 21 landmarks, no temporaries
+            # (the extension tests above already consumed the raw coords)
+            arr *= np.float32(-2.0)
+            arr += np.float32(1.0)
+            landmarks = arr
 
-            # Convert all 21 landmarks to NDC
-            landmarks = []
-            for l in lm:
-                landmarks.append((1.0 - l.x * 2.0, 1.0 - l.y * 2.0))
+            # Palm center: average of WRIST(0) and MIDDLE_MCP(9)
+            palm_ndc_x = float(landmarks[0, 0] + landmarks[9, 0]) / 2.0
+            palm_ndc_y = float(landmarks[0, 1] + landmarks[9, 1]) / 2.0
 
             return HandData(
                 detected=True,
@@ -97,7 +110,7 @@ try:
                 palm_ndc_x=palm_ndc_x,
                 palm_ndc_y=palm_ndc_y,
                 landmarks=landmarks,
-                finger_states=finger_states,
+                finger_states=finger_mask,
             )
 
         def close(self):
@@ -110,8 +123,8 @@ except (ImportError, Exception) as e:
         def __init__(self):
             pass
 
-        def process(self, frame_bgr) -> HandData:
-            return HandData()
+        def process(self, frame, already_rgb=False) -> HandData:
+            return NULL_HAND
 
         def close(self):
             pass
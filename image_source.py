@@ -2,11 +2,101 @@ import os
 import glob
 import cv2
 import numpy as np
+from numba import njit, prange
 
 PROCESS_W = 240
 PREVIEW_W, PREVIEW_H = 160, 120
 
 
+@njit(cache=True)
+def build_alias(probs):
+    """Walker alias-table construction — O(grid), run once per image."""
+    n = probs.shape[0]
+    q = np.empty(n, dtype=np.float64)
+    j = np.zeros(n, dtype=np.int32)
+    small = np.empty(n, dtype=np.int32)
+    large = np.empty(n, dtype=np.int32)
+    ns = 0
+    nl = 0
+    for i in range(n):
+        q[i] = probs[i] * n
+        if q[i] < 1.0:
+            small[ns] = i
+            ns += 1
+        else:
+            large[nl] = i
+            nl += 1
+    while ns > 0 and nl > 0:
+        ns -= 1
+        s = small[ns]
+        nl -= 1
+        l = large[nl]
+        j[s] = l
+        q[l] -= 1.0 - q[s]
+        if q[l] < 1.0:
+            small[ns] = l
+            ns += 1
+        else:
+            large[nl] = l
+            nl += 1
+    for i in range(ns):
+        q[small[i]] = 1.0
+    for i in range(nl):
+        q[large[i]] = 1.0
+    return q.astype(np.float32), j
+
+
+@njit(cache=True)
+def alias_sample(q, j, u1, u2, out):
+    """Draw len(out) indices from the alias table — O(1) per sample."""
+    n = q.shape[0]
+    for i in range(out.shape[0]):
+        k = int(u1[i] * n)
+        if k >= n:
+            k = n - 1
+        if u2[i] < q[k]:
+            out[i] = k
+        else:
+            out[i] = j[k]
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def fuse_weights(edges, sx, sy, gray, out_weight, out_bright):
+    """Fused Sobel-magnitude + brightness + spawn-weight pass.
+
+    Reads the uint8 Canny edges, int16 Sobel planes, and uint8 gray
+    image once, fills the preallocated float32 `out_weight` and
+    `out_bright` buffers, and returns the weight total — replaces the
+    chain of float64 sqrt/normalize/maximum/blend temporaries.
+    """
+    h, w = gray.shape
+
+    # Pass 1: raw gradient magnitude, stashed in out_weight, tracking max
+    mag_max = np.float32(1e-6)
+    for y in range(h):
+        for x in range(w):
+            fx = np.float32(sx[y, x])
+            fy = np.float32(sy[y, x])
+            m = np.sqrt(fx * fx + fy * fy)
+            out_weight[y, x] = m
+            if m > mag_max:
+                mag_max = m
+
+    # Pass 2: normalize and blend edges*0.5 + sobel*0.3 + brightness*0.2
+    inv_mag = 1.0 / mag_max
+    total = 0.0
+    for y in prange(h):
+        for x in range(w):
+            b = max(np.float32(gray[y, x]) * (1.0 / 255.0), 0.03)
+            out_bright[y, x] = b
+            wgt = (np.float32(edges[y, x]) * (0.5 / 255.0)
+                   + out_weight[y, x] * inv_mag * 0.3
+                   + b * 0.2)
+            out_weight[y, x] = wgt
+            total += wgt
+    return total
+
+
 class ImageSource:
     def __init__(self, image_dir, screen_w=1280, screen_h=720):
         self._screen_w = screen_w
@@ -33,13 +123,27 @@ class ImageSource:
 
         # Processed data
         self._spawn_probs = None
+        self._alias_q = None
+        self._alias_j = None
         self._color_map = None
         self._preview = np.zeros((PREVIEW_H, PREVIEW_W, 3), dtype=np.uint8)
+        self._preview_seq = 0  # bumps on every _load; consumers skip stale re-uploads
 
         # Dummy data for ModeController compat
         self._brightness = None
         self._weight_map = None
 
+        # Per-instance PCG64 generator — faster than the locked legacy
+        # np.random global — plus reusable uniform scratch rows
+        self._rng = np.random.default_rng()
+        self._uniform_buf = np.empty((2, 4096), dtype=np.float64)
+        self._jitter_buf = np.empty((2, 4096), dtype=np.float32)
+
+        # Reused output buffers — sample_colors / grid_to_ndc hand out
+        # views into these, valid until the next call
+        self._color_out = np.empty((4096, 3), dtype=np.float32)
+        self._ndc_out = np.empty((2, 4096), dtype=np.float32)
+
         if self._paths:
             self._load(self._paths[self._index])
 
@@ -86,95 +190,128 @@ class ImageSource:
         self._fit_w = fit_w
         self._fit_h = fit_h
 
+        # Bake the constant-per-image NDC mapping into lookup tables so
+        # grid_to_ndc is just a gather + jitter per spawn batch
+        cell_w = fit_w / self.grid_w
+        cell_h = fit_h / self.grid_h
+        offset_x = (self._screen_w - fit_w) / 2.0
+        offset_y = (self._screen_h - fit_h) / 2.0
+        self._ndc_x_lut = ((offset_x + (np.arange(self.grid_w) + 0.5) * cell_w)
+                           / self._screen_w * 2.0 - 1.0).astype(np.float32)
+        self._ndc_y_lut = (1.0 - (offset_y + (np.arange(self.grid_h) + 0.5) * cell_h)
+                           / self._screen_h * 2.0).astype(np.float32)
+        self._jit_x_scale = np.float32(cell_w / self._screen_w * 2.0)
+        self._jit_y_scale = np.float32(-cell_h / self._screen_h * 2.0)
+
         # Convert to RGB and grayscale
         rgb_proc = cv2.cvtColor(bgr_proc, cv2.COLOR_BGR2RGB)
         gray = cv2.cvtColor(bgr_proc, cv2.COLOR_BGR2GRAY)
 
         # --- Processing pipeline ---
 
-        # Canny edge detection
-        edges = cv2.Canny(gray, 50, 150).astype(np.float32) / 255.0
-
-        # Sobel gradient magnitude
-        sobel_x = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
-        sobel_y = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
-        sobel_mag = np.sqrt(sobel_x ** 2 + sobel_y ** 2)
-        sobel_max = sobel_mag.max()
-        if sobel_max > 0:
-            sobel_mag /= sobel_max
-        sobel = sobel_mag.astype(np.float32)
+        # Canny edge detection (stays uint8 — the fused kernel scales it)
+        edges = cv2.Canny(gray, 50, 150)
 
-        # Brightness from grayscale, floor at 0.03
-        brightness = np.maximum(gray.astype(np.float32) / 255.0, 0.03)
+        # Sobel at int16 — half the bandwidth of CV_64F, same 3x3 kernel
+        sobel_x = cv2.Sobel(gray, cv2.CV_16S, 1, 0, ksize=3)
+        sobel_y = cv2.Sobel(gray, cv2.CV_16S, 0, 1, ksize=3)
 
-        # Combined spawn weight
-        weight_map = edges * 0.5 + sobel * 0.3 + brightness * 0.2
+        # Fused magnitude + brightness + weight blend in one Numba pass
+        weight_map = np.empty((proc_h, PROCESS_W), dtype=np.float32)
+        brightness = np.empty((proc_h, PROCESS_W), dtype=np.float32)
+        total = float(fuse_weights(edges, sobel_x, sobel_y, gray,
+                                   weight_map, brightness))
 
         # Pre-flatten and normalize to probability distribution
         flat = weight_map.ravel()
-        total = flat.sum()
         if total < 1e-6:
             flat = np.ones_like(flat)
             total = flat.sum()
         self._spawn_probs = flat / total
 
-        # Store RGB color map (float32)
-        self._color_map = rgb_proc.astype(np.float32) / 255.0
+        # Alias table: O(1) per sample vs np.random.choice's CDF search
+        self._alias_q, self._alias_j = build_alias(self._spawn_probs)
+
+        # Store RGB color map as uint8 — sample_colors normalizes only
+        # the N gathered pixels, so no 4x float32 copy of the whole map
+        # and the scattered gather stays cache-resident. Any future
+        # gamma/contrast tweak belongs here as a one-time cv2.LUT on the
+        # uint8 map, not as a per-sample float op.
+        self._color_map = rgb_proc
 
         # Store for ModeController compat
         self._brightness = brightness
         self._weight_map = weight_map
 
-        # Preview image (160x120)
-        self._preview = cv2.resize(rgb_proc, (PREVIEW_W, PREVIEW_H),
-                                   interpolation=cv2.INTER_AREA)
+        # Preview image (160x120) — reuse the buffer allocated in __init__
+        cv2.resize(rgb_proc, (PREVIEW_W, PREVIEW_H),
+                   dst=self._preview, interpolation=cv2.INTER_NEAREST)
+        self._preview_seq += 1
 
     def get_spawn_indices(self, n):
-        if self._spawn_probs is None:
+        if self._alias_q is None:
             return np.zeros(n, dtype=np.int32), np.zeros(n, dtype=np.int32)
-        indices = np.random.choice(len(self._spawn_probs), size=n, replace=True,
-                                   p=self._spawn_probs)
+        if n > self._uniform_buf.shape[1]:
+            self._uniform_buf = np.empty((2, n), dtype=np.float64)
+        u = self._uniform_buf
+        self._rng.random(out=u[0, :n])
+        self._rng.random(out=u[1, :n])
+        indices = np.empty(n, dtype=np.int32)
+        alias_sample(self._alias_q, self._alias_j, u[0, :n], u[1, :n], indices)
         gy, gx = np.unravel_index(indices, (self.grid_h, self.grid_w))
         return gy.astype(np.int32), gx.astype(np.int32)
 
     def sample_colors(self, gy, gx):
+        n = len(gy)
         if self._color_map is None:
-            n = len(gy)
             return np.zeros(n, np.float32), np.zeros(n, np.float32), np.zeros(n, np.float32)
+        if n > self._color_out.shape[0]:
+            self._color_out = np.empty((n, 3), dtype=np.float32)
         gy_c = np.clip(gy, 0, self.grid_h - 1)
         gx_c = np.clip(gx, 0, self.grid_w - 1)
-        r = self._color_map[gy_c, gx_c, 0]
-        g = self._color_map[gy_c, gx_c, 1]
-        b = self._color_map[gy_c, gx_c, 2]
-        return r.astype(np.float32), g.astype(np.float32), b.astype(np.float32)
+        # Gather uint8 pixels straight into the float32 output, then
+        # normalize in place — the returned views are valid until the
+        # next sample_colors call
+        out = self._color_out[:n]
+        out[:] = self._color_map[gy_c, gx_c]
+        out *= np.float32(1.0 / 255.0)
+        return out[:, 0], out[:, 1], out[:, 2]
 
     def grid_to_ndc(self, gy, gx):
-        # Map grid coords to NDC, centered on screen
-        # Image is centered within 1280x720, so we need to account for letterboxing
-        # Grid cell size in screen pixels
-        cell_w = self._fit_w / self.grid_w
-        cell_h = self._fit_h / self.grid_h
-
-        # Screen pixel position (centered)
-        offset_x = (self._screen_w - self._fit_w) / 2.0
-        offset_y = (self._screen_h - self._fit_h) / 2.0
-
-        px = offset_x + gx.astype(np.float32) * cell_w + cell_w * 0.5
-        py = offset_y + gy.astype(np.float32) * cell_h + cell_h * 0.5
-
-        # Sub-cell jitter
+        # Cell centers (with letterbox offset) are baked into the LUTs
+        # at load time; per batch this is a gather plus sub-cell jitter
         n = len(gx)
-        px += np.random.uniform(-cell_w * 0.5, cell_w * 0.5, n).astype(np.float32)
-        py += np.random.uniform(-cell_h * 0.5, cell_h * 0.5, n).astype(np.float32)
-
-        # Convert to NDC (-1..1)
-        nx = (px / self._screen_w) * 2.0 - 1.0
-        ny = 1.0 - (py / self._screen_h) * 2.0  # flip Y (screen top = NDC +1)
-
-        return nx.astype(np.float32), ny.astype(np.float32)
+        if n > self._jitter_buf.shape[1]:
+            self._jitter_buf = np.empty((2, n), dtype=np.float32)
+            self._ndc_out = np.empty((2, n), dtype=np.float32)
+        j = self._jitter_buf
+        self._rng.random(out=j[0, :n], dtype=np.float32)
+        self._rng.random(out=j[1, :n], dtype=np.float32)
+
+        # Scale jitter in place, gather the LUT into the output rows,
+        # add — zero fresh allocations; the returned views are valid
+        # until the next grid_to_ndc call
+        jx = j[0, :n]
+        jx -= 0.5
+        jx *= self._jit_x_scale
+        jy = j[1, :n]
+        jy -= 0.5
+        jy *= self._jit_y_scale
+
+        nx = self._ndc_out[0, :n]
+        ny = self._ndc_out[1, :n]
+        np.take(self._ndc_x_lut, gx, out=nx)
+        np.take(self._ndc_y_lut, gy, out=ny)
+        nx += jx
+        ny += jy
+        return nx, ny
 
     def get_preview(self):
-        return self._preview.copy()
+        """Return (seq, preview). The sequence number only advances when
+        a new image is loaded, letting consumers skip re-uploading an
+        unchanged frame; the array is a read-only reference, not a copy.
+        """
+        return self._preview_seq, self._preview
 
     def get_data(self):
         if self._brightness is None:
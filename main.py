@@ -2,14 +2,14 @@ import os
 import math
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 import numpy as np
 import pyglet
 from pyglet.window import key
 import moderngl
 
-from image_source import ImageSource
-from particles import ParticleSystem, MAX_PARTICLES
+from particles import ParticleSystem, MAX_PARTICLES, GPU_DTYPE
 from gui import GameMenu
 
 WIDTH, HEIGHT = 1280, 720
@@ -60,16 +60,19 @@ class SoundManager:
         self._sounds = {}
         self._prev_ember = False
 
-        # Pre-load ambience source but don't play yet
-        self._ambience_source = self._load_source(AUDIO_OPENING)
-
-        # Load all one-shot sounds
-        for name in (AUDIO_EMBER_IGNITE, AUDIO_HUMANITY_RESTORED, AUDIO_BONFIRE_LIT,
-                     AUDIO_CAMERA_ON, AUDIO_HELP, AUDIO_QUIT, AUDIO_MODE_CYCLE,
-                     AUDIO_BOSS_OUT, AUDIO_START):
-            src = self._load_source(name)
-            if src is not None:
-                self._sounds[name] = src
+        # Decode everything in parallel — pyglet.media.load releases the
+        # GIL in the decoder, so startup pays max(decode) instead of the
+        # sum. The ambience rides in the same pool (it isn't needed
+        # until the intro). Players are still created on the main
+        # thread only.
+        names = (AUDIO_OPENING, AUDIO_EMBER_IGNITE, AUDIO_HUMANITY_RESTORED,
+                 AUDIO_BONFIRE_LIT, AUDIO_CAMERA_ON, AUDIO_HELP, AUDIO_QUIT,
+                 AUDIO_MODE_CYCLE, AUDIO_BOSS_OUT, AUDIO_START)
+        with ThreadPoolExecutor(max_workers=min(4, len(names))) as ex:
+            sources = dict(zip(names, ex.map(self._load_source, names)))
+        # Ambience source is held separately and not played yet
+        self._ambience_source = sources.pop(AUDIO_OPENING)
+        self._sounds = {n: s for n, s in sources.items() if s is not None}
 
     def start_ambience(self):
         """Start looping ambience playback (called on intro state entry)."""
@@ -161,6 +164,14 @@ IMAGE_EMBER_DURATION = 8.0
 
 
 class ModeController:
+    """Humanity/Ember state machine (forced modes + auto hysteresis).
+
+    Deliberately plain Python: it runs once per sim tick on a handful
+    of scalars, where njit dispatch/boxing would cost more than the
+    comparisons it replaces. Revisit only if this ever moves inside a
+    per-particle or per-landmark loop.
+    """
+
     def __init__(self):
         self.mode = MODE_AUTO
         self.is_ember = False
@@ -168,17 +179,25 @@ class ModeController:
         self._last_high = 0.0
         self._cycle_start = time.monotonic()
 
-    def cycle(self):
+    def cycle(self, now=None):
         self.mode = (self.mode + 1) % 3
-        self._cycle_start = time.monotonic()
+        # Callers with a frame-coherent timestamp pass it in; standalone
+        # use falls back to reading the clock
+        self._cycle_start = now if now is not None else time.monotonic()
 
-    def update_camera(self, avg_motion, now, hand_is_open_palm=False):
-        """Motion-based hysteresis for camera mode, supplemented by open palm."""
+    def _apply_force_mode(self):
+        """Apply a forced mode if one is set; True means skip auto logic."""
         if self.mode == MODE_FORCE_HUMANITY:
             self.is_ember = False
-            return
+            return True
         if self.mode == MODE_FORCE_EMBER:
             self.is_ember = True
+            return True
+        return False
+
+    def update_camera(self, avg_motion, now, hand_is_open_palm=False):
+        """Motion-based hysteresis for camera mode, supplemented by open palm."""
+        if self._apply_force_mode():
             return
 
         # Open palm supplements motion: either trigger -> ember active
@@ -194,11 +213,7 @@ class ModeController:
 
     def update_image(self, now):
         """Time-based auto-cycle for image mode."""
-        if self.mode == MODE_FORCE_HUMANITY:
-            self.is_ember = False
-            return
-        if self.mode == MODE_FORCE_EMBER:
-            self.is_ember = True
+        if self._apply_force_mode():
             return
 
         # Auto cycle: 12s Humanity -> 8s Ember -> repeat
@@ -225,9 +240,32 @@ _HAND_CONNECTIONS = [
     (0, 5), (5, 9), (9, 13), (13, 17), (0, 17),
 ]
 
-_FINGERTIPS = {4, 8, 12, 16, 20}
 _FINGER_NAMES = ["thumb", "index", "middle", "ring", "pinky"]
 
+# Finger index (0=thumb .. 4=pinky) per joint, -1 for non-tip joints —
+# one array in place of the old fingertip set + tip->finger dict, so
+# tip membership is a whole-array mask rather than a per-joint lookup
+_JOINT_FINGER_IDX = np.full(21, -1, dtype=np.int8)
+_JOINT_FINGER_IDX[[4, 8, 12, 16, 20]] = np.arange(5)
+
+# Fingertip joint colors for the debug skeleton
+_TIP_EXTENDED_COLOR = np.array([0.2, 1.0, 0.2], dtype="f4")   # green
+_TIP_CLOSED_COLOR = np.array([1.0, 0.1, 0.1], dtype="f4")     # red
+
+# Constant GPU-side geometry, evaluated once at import: the skeleton
+# connection gather indices and the preview's unit quad (pos + uv, two
+# triangles — placement happens in the ndc_rect uniform)
+_CONN_IDX = np.array(_HAND_CONNECTIONS, dtype=np.int32)
+_TIP_MASK = _JOINT_FINGER_IDX >= 0
+_PREVIEW_QUAD = np.array([
+    0, 0, 0, 1,
+    1, 0, 1, 1,
+    1, 1, 1, 0,
+    0, 0, 0, 1,
+    1, 1, 1, 0,
+    0, 1, 0, 0,
+], dtype="f4")
+
 
 class DebugOverlay:
     def __init__(self, ctx, win_w=WIDTH, win_h=HEIGHT):
@@ -235,16 +273,37 @@ class DebugOverlay:
         self._ctx = ctx
         self._win_w = win_w
         self._win_h = win_h
-        self._tex = ctx.texture((160, 120), 3)
+        # GPU resources are built lazily on first use — a run that never
+        # opens the overlay pays nothing for it
+        self._tex = None
+        self._prog = None
+        self._hand_prog = None
+
+        # Reusable vertex scratch: rows 0..41 are line endpoints, rows
+        # 42..62 the joint points. The scratch array goes to Buffer.write
+        # via the buffer protocol, so NumPy -> GL is the only host-side
+        # copy per frame.
+        self._vbuf = np.empty((63, 5), dtype="f4")
+        self._last_preview_seq = None
+
+        # All 21 possible EMA bar strings, indexed by fill count — the
+        # hand panel picks from this table instead of rebuilding per frame
+        self._bar_cache = ["|" + "#" * i + "-" * (20 - i) + "|" for i in range(21)]
+        self._prev_ext = [None] * 5
+
+    def _ensure_preview_gpu(self):
+        """Build the preview texture/shader/quad on first debug draw."""
+        self._tex = self._ctx.texture((160, 120), 3)
         self._tex.filter = (moderngl.NEAREST, moderngl.NEAREST)
 
         vert = """
         #version 330 core
         in vec2 in_pos;
         in vec2 in_uv;
+        uniform vec4 ndc_rect;  // xy = origin, zw = size
         out vec2 v_uv;
         void main() {
-            gl_Position = vec4(in_pos, 0.0, 1.0);
+            gl_Position = vec4(ndc_rect.xy + in_pos * ndc_rect.zw, 0.0, 1.0);
             v_uv = in_uv;
         }
         """
@@ -257,38 +316,33 @@ class DebugOverlay:
             frag_color = vec4(texture(tex, v_uv).rgb, 0.8);
         }
         """
-        self._prog = ctx.program(vertex_shader=vert, fragment_shader=frag)
-
-        self._preview_vbo = ctx.buffer(reserve=6 * 4 * 4)
-        self._vao = ctx.vertex_array(self._prog, [(self._preview_vbo, "2f 2f", "in_pos", "in_uv")])
-        self._rebuild_preview_quad(win_w, win_h)
-
-    def _rebuild_preview_quad(self, win_w, win_h):
-        """Rebuild the preview quad VBO for current window size."""
-        qw = 160 / win_w * 2.0
-        qh = 120 / win_h * 2.0
-        x0, y0 = -1.0, -1.0
-        x1, y1 = x0 + qw, y0 + qh
-        verts = np.array([
-            x0, y0, 0, 1,
-            x1, y0, 1, 1,
-            x1, y1, 1, 0,
-            x0, y0, 0, 1,
-            x1, y1, 1, 0,
-            x0, y1, 0, 0,
-        ], dtype="f4")
-        self._preview_vbo.orphan()
-        self._preview_vbo.write(verts.tobytes())
+        self._prog = self._ctx.program(vertex_shader=vert, fragment_shader=frag)
+
+        # Static unit quad, written once — window-size placement happens
+        # in the ndc_rect uniform, so a resize touches no buffer at all
+        self._preview_vbo = self._ctx.buffer(_PREVIEW_QUAD)
+        self._vao = self._ctx.vertex_array(
+            self._prog, [(self._preview_vbo, "2f 2f", "in_pos", "in_uv")])
+        self._update_preview_rect()
+
+    def _update_preview_rect(self):
+        """Point the preview quad's ndc_rect uniform at the bottom-left."""
+        qw = 160 / self._win_w * 2.0
+        qh = 120 / self._win_h * 2.0
+        self._prog["ndc_rect"].value = (-1.0, -1.0, qw, qh)
 
     def resize(self, win_w, win_h):
         """Update positions for new window dimensions."""
         self._win_w = win_w
         self._win_h = win_h
-        self._rebuild_preview_quad(win_w, win_h)
+        if self._prog is not None:
+            self._update_preview_rect()
         # Reset lazy-init flag so hand panel labels get recreated at new positions
         if hasattr(self, "_hand_panel_labels"):
             del self._hand_panel_labels
 
+    def _ensure_hand_gpu(self):
+        """Build the hand-skeleton shader and VBO ring on first use."""
         # Hand skeleton line/point shader
         hand_vert = """
         #version 330 core
@@ -310,27 +364,49 @@ class DebugOverlay:
         }
         """
         self._hand_prog = self._ctx.program(vertex_shader=hand_vert, fragment_shader=hand_frag)
-        # 21 connections * 2 verts = 42 line verts + 21 joint points = 63 max
-        self._hand_vbo = self._ctx.buffer(reserve=63 * 5 * 4)
-        self._hand_line_vao = self._ctx.vertex_array(
-            self._hand_prog,
-            [(self._hand_vbo, "2f 3f", "in_pos", "in_color")],
-        )
+        # 21 connections * 2 verts = 42 line verts + 21 joint points = 63 max.
+        # Three-deep ring, same scheme as the particle VBOs — rotate instead
+        # of orphaning so the driver never stalls on an in-flight buffer.
+        self._hand_vbo_ring = [
+            self._ctx.buffer(reserve=63 * 5 * 4, dynamic=True) for _ in range(3)
+        ]
+        self._hand_vao_ring = [
+            self._ctx.vertex_array(
+                self._hand_prog,
+                [(vbo, "2f 3f", "in_pos", "in_color")],
+            )
+            for vbo in self._hand_vbo_ring
+        ]
+        self._hand_ring_idx = 0
 
-    def draw(self, preview_rgb):
+    def draw(self, preview_rgb, seq):
         if not self.enabled:
             return
-        self._tex.write(preview_rgb.tobytes())
+        if self._prog is None:
+            self._ensure_preview_gpu()
+        # The texture storage is preallocated, so write() is a plain
+        # glTexSubImage2D straight from the ndarray — both producers
+        # hand out contiguous uint8 buffers they refill in place, so no
+        # scratch copy is needed — and even that is skipped while the
+        # source frame is unchanged (seq comes from the producer's
+        # frame counter)
+        if seq != self._last_preview_seq:
+            self._tex.write(preview_rgb)
+            self._last_preview_seq = seq
         self._tex.use(0)
         self._vao.render(moderngl.TRIANGLES)
 
     def draw_hand(self, hand_data):
+        """Render the hand skeleton overlay (vectorized assembly — the
+        whole 63-vertex buffer is filled by array ops; no Python loop,
+        list building or per-connection tuple unpacking survives)."""
         if not self.enabled or not hand_data.detected or hand_data.landmarks is None:
             return
+        if self._hand_prog is None:
+            self._ensure_hand_gpu()
 
-        lm = hand_data.landmarks
+        lm = np.asarray(hand_data.landmarks, dtype="f4")
         is_open = hand_data.is_open_palm
-        finger_states = hand_data.finger_states or {}
 
         # Skeleton color: green when open palm, cyan when closed
         if is_open:
@@ -340,40 +416,39 @@ class DebugOverlay:
             line_color = (0.0, 0.8, 0.8)
             joint_color = (0.0, 0.9, 1.0)
 
-        # Fingertip index -> finger name for per-finger coloring
-        tip_to_name = {4: "thumb", 8: "index", 12: "middle", 16: "ring", 20: "pinky"}
-
-        # Build line vertices: 2 verts per connection
-        buf = []
-        for a, b in _HAND_CONNECTIONS:
-            ax, ay = lm[a]
-            bx, by = lm[b]
-            buf.extend([ax, ay, *line_color, bx, by, *line_color])
-
-        line_count = len(_HAND_CONNECTIONS) * 2
-
-        # Build joint point vertices: 1 vert per landmark
-        # Fingertips: green if extended, red if not
-        for i, (x, y) in enumerate(lm):
-            if i in _FINGERTIPS:
-                fname = tip_to_name[i]
-                if finger_states.get(fname, False):
-                    c = (0.2, 1.0, 0.2)  # green = extended
-                else:
-                    c = (1.0, 0.1, 0.1)  # red = closed
-            else:
-                c = joint_color
-            buf.extend([x, y, *c])
+        vb = self._vbuf
+
+        # Line vertices: gather both endpoints of every connection at once
+        vb[:42, 0:2] = lm[_CONN_IDX].reshape(-1, 2)
+        vb[:42, 2:5] = line_color
 
-        joint_count = len(lm)
+        # Joint point vertices; fingertips colored green/red by extension
+        vb[42:, 0:2] = lm
+        joint_colors = vb[42:, 2:5]
+        joint_colors[:] = joint_color
+        # Unpack the extension bitmask for all 5 fingers in one shift
+        ext = (hand_data.finger_states >> np.arange(5)) & 1
+        joint_colors[_TIP_MASK] = np.where(
+            ext[:, None] != 0, _TIP_EXTENDED_COLOR, _TIP_CLOSED_COLOR)
 
-        data = np.array(buf, dtype="f4")
-        self._hand_vbo.orphan()
-        self._hand_vbo.write(data.tobytes())
+        self._hand_ring_idx = (self._hand_ring_idx + 1) % 3
+        # vb is C-contiguous by construction — write() takes it through
+        # the buffer protocol with no tobytes round-trip
+        self._hand_vbo_ring[self._hand_ring_idx].write(vb)
 
         # Draw lines first, then points on top
-        self._hand_line_vao.render(moderngl.LINES, vertices=line_count)
-        self._hand_line_vao.render(moderngl.POINTS, vertices=joint_count, first=line_count)
+        vao = self._hand_vao_ring[self._hand_ring_idx]
+        vao.render(moderngl.LINES, vertices=42)
+        vao.render(moderngl.POINTS, vertices=21, first=42)
+
+    def _set(self, lbl, txt, last_attr):
+        """Assign label text only when it changed — every assignment makes
+        pyglet relayout the glyphs and re-upload a vertex buffer."""
+        if getattr(self, last_attr, None) != txt:
+            lbl.text = txt
+            setattr(self, last_attr, txt)
+            return True
+        return False
 
     def draw_hand_panel(self, hand_data, ema_confidence):
         """Draw hand tracking status panel (pyglet labels) in bottom-right."""
@@ -381,18 +456,22 @@ class DebugOverlay:
             return
 
         if not hasattr(self, "_hand_panel_labels"):
-            # Lazy-init labels for the hand panel
+            # Lazy-init labels for the hand panel — one shared Batch so
+            # the whole panel is a single draw call
+            self._hand_batch = pyglet.graphics.Batch()
             rx = self._win_w - 20
             self._hand_status_label = pyglet.text.Label(
                 "", font_name="Consolas", font_size=14,
                 x=rx, y=160,
                 anchor_x="right", anchor_y="center",
+                batch=self._hand_batch,
             )
             self._hand_ema_label = pyglet.text.Label(
                 "", font_name="Consolas", font_size=10,
                 x=rx, y=140,
                 anchor_x="right", anchor_y="center",
                 color=(180, 180, 180, 200),
+                batch=self._hand_batch,
             )
             self._hand_finger_labels = []
             for i in range(5):
@@ -400,6 +479,7 @@ class DebugOverlay:
                     "", font_name="Consolas", font_size=11,
                     x=rx, y=118 - i * 18,
                     anchor_x="right", anchor_y="center",
+                    batch=self._hand_batch,
                 )
                 self._hand_finger_labels.append(lbl)
             self._hand_ndc_label = pyglet.text.Label(
@@ -407,58 +487,80 @@ class DebugOverlay:
                 x=rx, y=20,
                 anchor_x="right", anchor_y="center",
                 color=(180, 180, 180, 200),
+                batch=self._hand_batch,
             )
             self._hand_panel_labels = True
-
-        if not hand_data.detected:
-            self._hand_status_label.text = "Hand: not detected"
-            self._hand_status_label.color = (180, 80, 80, 220)
-            self._hand_status_label.draw()
-            self._hand_ema_label.text = f"EMA: {ema_confidence:.3f}"
-            self._hand_ema_label.draw()
+            # Fresh labels start empty — drop any cached last-set strings
+            self._last_status = self._last_ema = self._last_ndc = None
+            self._last_ema_bucket = None
+            self._last_ndc_xy = None
+            self._prev_ext = [None] * 5
+            self._panel_detected = None
+
+        # Batched labels always draw, so the detection-dependent ones
+        # hide via alpha 0 rather than by skipping their draw calls
+        detected = hand_data.detected
+        if detected != self._panel_detected:
+            self._hand_ndc_label.color = (180, 180, 180, 200 if detected else 0)
+            if not detected:
+                for lbl in self._hand_finger_labels:
+                    lbl.color = (0, 0, 0, 0)
+                self._prev_ext = [None] * 5
+            self._panel_detected = detected
+
+        if not detected:
+            if self._set(self._hand_status_label, "Hand: not detected", "_last_status"):
+                self._hand_status_label.color = (180, 80, 80, 220)
+            bucket = int(min(ema_confidence, 1.0) * 1000)
+            if bucket != self._last_ema_bucket:
+                self._set(self._hand_ema_label, f"EMA: {ema_confidence:.3f}", "_last_ema")
+                self._last_ema_bucket = bucket
+            self._hand_batch.draw()
             return
 
-        finger_states = hand_data.finger_states or {}
         is_open = hand_data.is_open_palm
 
-        # Status
+        # Status — color only needs touching when the text flips with it
         if is_open:
-            self._hand_status_label.text = "OPEN PALM"
-            self._hand_status_label.color = (80, 255, 80, 255)
+            if self._set(self._hand_status_label, "OPEN PALM", "_last_status"):
+                self._hand_status_label.color = (80, 255, 80, 255)
         else:
-            self._hand_status_label.text = "CLOSED"
-            self._hand_status_label.color = (80, 200, 255, 220)
-        self._hand_status_label.draw()
-
-        # EMA bar as text
-        bar_len = 20
-        filled = int(min(ema_confidence, 1.0) * bar_len)
-        bar = "|" + "#" * filled + "-" * (bar_len - filled) + "|"
-        thresh_pos = int(0.5 * bar_len) + 1  # +1 for leading |
-        self._hand_ema_label.text = f"EMA: {ema_confidence:.3f} {bar}"
-        self._hand_ema_label.draw()
-
-        # Per-finger status
+            if self._set(self._hand_status_label, "CLOSED", "_last_status"):
+                self._hand_status_label.color = (80, 200, 255, 220)
+
+        # EMA bar as text — the 21 bar variants come from the startup
+        # table. Bucketed at display precision so a settled EMA (decayed
+        # to 0, or pinned at 1) skips even the f-string
+        bucket = int(min(ema_confidence, 1.0) * 1000)
+        if bucket != self._last_ema_bucket:
+            bar = self._bar_cache[bucket // 50]
+            self._set(self._hand_ema_label, f"EMA: {ema_confidence:.3f} {bar}", "_last_ema")
+            self._last_ema_bucket = bucket
+
+        # Per-finger status — text and color flip only on extension changes
         for i, fname in enumerate(_FINGER_NAMES):
-            extended = finger_states.get(fname, False)
-            marker = "[X]" if extended else "[ ]"
-            self._hand_finger_labels[i].text = f"{marker} {fname}"
-            if extended:
-                self._hand_finger_labels[i].color = (80, 255, 80, 220)
-            else:
-                self._hand_finger_labels[i].color = (255, 80, 80, 220)
-            self._hand_finger_labels[i].draw()
+            extended = hand_data.finger_state(i)
+            if extended != self._prev_ext[i]:
+                lbl = self._hand_finger_labels[i]
+                marker = "[X]" if extended else "[ ]"
+                lbl.text = f"{marker} {fname}"
+                lbl.color = (80, 255, 80, 220) if extended else (255, 80, 80, 220)
+                self._prev_ext[i] = extended
 
-        # NDC
-        self._hand_ndc_label.text = (
-            f"Palm NDC: ({hand_data.palm_ndc_x:.2f}, {hand_data.palm_ndc_y:.2f})"
-        )
-        self._hand_ndc_label.draw()
+        # NDC — quantized to display precision first, so sub-0.01 palm
+        # jitter skips the f-string as well as the relayout
+        ndc = (round(hand_data.palm_ndc_x, 2), round(hand_data.palm_ndc_y, 2))
+        if ndc != self._last_ndc_xy:
+            self._set(self._hand_ndc_label,
+                      f"Palm NDC: ({ndc[0]:.2f}, {ndc[1]:.2f})", "_last_ndc")
+            self._last_ndc_xy = ndc
+
+        self._hand_batch.draw()
 
 
 # --- Soul Overlay (Dark Souls GUI) ---
 
-_SOUL_QUOTES = [
+_SOUL_QUOTES = (
     "Don't you dare go hollow.",
     "Praise the Sun!",
     "If only I could be so grossly incandescent...",
@@ -474,7 +576,7 @@ _SOUL_QUOTES = [
     "The fire fades, and the lords go without thrones.",
     "Touch the darkness within me.",
     "Hand it over. That thing, your dark soul.",
-]
+)
 
 _HELP_TEXT = (
     "\u2500\u2500 Soul Stream \u2500\u2500\n"
@@ -508,27 +610,50 @@ _HELP_TEXT = (
 _BANNER_FADE_IN = 0.5
 _BANNER_HOLD = 2.0
 _BANNER_FADE_OUT = 1.0
+_BANNER_HOLD_END = _BANNER_FADE_IN + _BANNER_HOLD
 _BANNER_TOTAL = _BANNER_FADE_IN + _BANNER_HOLD + _BANNER_FADE_OUT
+# Per-phase seconds -> 8-bit alpha scales, folded into one multiply
+_BANNER_IN_SCALE = 255.0 / _BANNER_FADE_IN
+_BANNER_OUT_SCALE = 255.0 / _BANNER_FADE_OUT
 
 # Quote timing (seconds)
 _QUOTE_DISPLAY = 8.0
 _QUOTE_FADE_OUT = 2.0
 _QUOTE_FADE_IN = 2.0
+_QUOTE_FADE_END = _QUOTE_DISPLAY + _QUOTE_FADE_OUT
 _QUOTE_CYCLE = _QUOTE_DISPLAY + _QUOTE_FADE_OUT + _QUOTE_FADE_IN
+_QUOTE_OUT_SCALE = 200.0 / _QUOTE_FADE_OUT   # quotes peak at alpha 200
+_QUOTE_IN_SCALE = 200.0 / _QUOTE_FADE_IN
 
 
 class SoulOverlay:
     def __init__(self):
+        # One Batch per overlay group — each group draws with a single
+        # GL call instead of one per label. Groups stay separate (rather
+        # than one app-wide batch) because each toggles independently:
+        # batched labels always render, so a merged batch would need
+        # every hidden element zeroed out instead of simply not drawn.
+        self._banner_batch = pyglet.graphics.Batch()
+        self._quote_batch = pyglet.graphics.Batch()
+
         # --- Banner ---
         self._banner_label = pyglet.text.Label(
             "", font_name="Georgia", font_size=48,
             x=WIDTH // 2, y=HEIGHT // 2,
             anchor_x="center", anchor_y="center",
             color=(255, 255, 255, 0),
+            batch=self._banner_batch,
         )
         self._banner_timer = 0.0
         self._banner_active = False
-        self._banner_color = (255, 255, 255)
+        # Reused RGBA buffers — Label.color takes any 4-sequence, so the
+        # fades mutate the alpha slot instead of building a tuple per write
+        self._banner_rgba = [255, 255, 255, 0]
+        self._quote_rgba = [160, 150, 130, 0]
+        # Last-written alphas — plateau phases skip the color writes
+        # (each one dirties the label's vertex list)
+        self._banner_last_alpha = -1
+        self._quote_last_alpha = -1
 
         # --- Quotes ---
         self._quote_label = pyglet.text.Label(
@@ -536,25 +661,24 @@ class SoulOverlay:
             x=WIDTH // 2, y=40,
             anchor_x="center", anchor_y="center",
             color=(160, 150, 130, 0),
+            batch=self._quote_batch,
         )
-        self._quotes = list(_SOUL_QUOTES)
-        random.shuffle(self._quotes)
+        # Shared immutable quotes, per-instance index permutation — the
+        # only mutable quote state is the small cursor list
+        self._quote_order = random.sample(range(len(_SOUL_QUOTES)), len(_SOUL_QUOTES))
         self._quote_idx = 0
         self._quote_timer = 0.0
-        self._quote_label.text = self._quotes[0]
+        self._quote_label.text = _SOUL_QUOTES[self._quote_order[0]]
 
         # --- Help Panel ---
+        # Static text: one multiline label lays the whole panel out in
+        # a single document and draws in one call — no per-line Label
+        # objects or batch bookkeeping. Built lazily on the first H
+        # press, so runs that never open help skip the layout cost.
         self._help_visible = False
-        self._help_labels = []
-        lines = _HELP_TEXT.split("\n")
-        for i, line in enumerate(lines):
-            lbl = pyglet.text.Label(
-                line, font_name="Consolas", font_size=13,
-                x=WIDTH - 20, y=HEIGHT - 30 - i * 20,
-                anchor_x="right", anchor_y="center",
-                color=(160, 160, 160, 180),
-            )
-            self._help_labels.append(lbl)
+        self._help_label = None
+        self._win_w = WIDTH
+        self._win_h = HEIGHT
 
         # --- State tracking ---
         self._prev_ember = False
@@ -565,19 +689,30 @@ class SoulOverlay:
         self._banner_label.x = win_w // 2
         self._banner_label.y = win_h // 2
         self._quote_label.x = win_w // 2
-        for i, lbl in enumerate(self._help_labels):
-            lbl.x = win_w - 20
-            lbl.y = win_h - 30 - i * 20
+        self._win_w = win_w
+        self._win_h = win_h
+        if self._help_label is not None:
+            self._help_label.x = win_w - 20
+            self._help_label.y = win_h - 20
 
     def trigger_banner(self, text, color):
         """Start a banner fade-in -> hold -> fade-out animation."""
         self._banner_label.text = text
-        self._banner_color = color
+        self._banner_rgba[:3] = color
         self._banner_timer = 0.0
         self._banner_active = True
+        self._banner_last_alpha = -1  # new color — force the first write
 
     def toggle_help(self):
         self._help_visible = not self._help_visible
+        if self._help_visible and self._help_label is None:
+            self._help_label = pyglet.text.Label(
+                _HELP_TEXT, font_name="Consolas", font_size=13,
+                x=self._win_w - 20, y=self._win_h - 20,
+                width=420, multiline=True,
+                anchor_x="right", anchor_y="top", align="right",
+                color=(160, 160, 160, 180),
+            )
 
     def update(self, dt, is_ember, image_name=None):
         # Detect mode transitions
@@ -600,47 +735,65 @@ class SoulOverlay:
             if self._banner_timer >= _BANNER_TOTAL:
                 self._banner_active = False
 
-        # Advance quote timer
+        # Advance quote timer. The text swap (and its glyph relayout)
+        # happens once per ~12 s cycle, while the quote is invisible
+        # between fade-out and fade-in — not worth pre-rendering
         self._quote_timer += dt
         if self._quote_timer >= _QUOTE_CYCLE:
             self._quote_timer = 0.0
-            self._quote_idx = (self._quote_idx + 1) % len(self._quotes)
-            self._quote_label.text = self._quotes[self._quote_idx]
+            self._quote_idx = (self._quote_idx + 1) % len(_SOUL_QUOTES)
+            self._quote_label.text = _SOUL_QUOTES[self._quote_order[self._quote_idx]]
 
     def draw(self):
         # --- Banner ---
         if self._banner_active:
+            # Each phase produces the 8-bit alpha directly (cheaper for
+            # a scalar than an np.interp keyframe table) — the only
+            # clamp needed is the fade-out tail, where a late frame can
+            # overshoot _BANNER_TOTAL before update() deactivates
             t = self._banner_timer
             if t < _BANNER_FADE_IN:
-                alpha = t / _BANNER_FADE_IN
-            elif t < _BANNER_FADE_IN + _BANNER_HOLD:
-                alpha = 1.0
+                a = int(t * _BANNER_IN_SCALE)
+            elif t < _BANNER_HOLD_END:
+                a = 255
             else:
-                alpha = 1.0 - (t - _BANNER_FADE_IN - _BANNER_HOLD) / _BANNER_FADE_OUT
-            alpha = max(0.0, min(1.0, alpha))
-            r, g, b = self._banner_color
-            self._banner_label.color = (r, g, b, int(alpha * 255))
-            self._banner_label.draw()
+                a = int((_BANNER_TOTAL - t) * _BANNER_OUT_SCALE)
+                if a < 0:
+                    a = 0
+            # Hold phase keeps alpha constant — only dirty the vertex
+            # list while it's actually fading
+            if a != self._banner_last_alpha:
+                self._banner_rgba[3] = a
+                self._banner_label.color = self._banner_rgba
+                self._banner_last_alpha = a
+            self._banner_batch.draw()
 
         # --- Quote ---
         t = self._quote_timer
         if t < _QUOTE_DISPLAY:
             # Fully visible (after initial fade-in completes from prev cycle)
-            alpha = 1.0
-        elif t < _QUOTE_DISPLAY + _QUOTE_FADE_OUT:
+            a = 200
+        elif t < _QUOTE_FADE_END:
             # Fading out
-            alpha = 1.0 - (t - _QUOTE_DISPLAY) / _QUOTE_FADE_OUT
+            a = int((_QUOTE_FADE_END - t) * _QUOTE_OUT_SCALE)
         else:
-            # Fading in (new quote already set at cycle boundary)
-            alpha = (t - _QUOTE_DISPLAY - _QUOTE_FADE_OUT) / _QUOTE_FADE_IN
-        alpha = max(0.0, min(1.0, alpha))
-        self._quote_label.color = (160, 150, 130, int(alpha * 200))
-        self._quote_label.draw()
+            # Fading in (new quote already set at cycle boundary); a late
+            # frame past _QUOTE_CYCLE would otherwise overshoot the peak
+            a = int((t - _QUOTE_FADE_END) * _QUOTE_IN_SCALE)
+            if a > 200:
+                a = 200
+        # Fully faded out (the instant between fade-out and fade-in):
+        # nothing would be visible, so skip the assignment and the draw
+        if a > 0:
+            if a != self._quote_last_alpha:
+                self._quote_rgba[3] = a
+                self._quote_label.color = self._quote_rgba
+                self._quote_last_alpha = a
+            self._quote_batch.draw()
 
         # --- Help Panel ---
         if self._help_visible:
-            for lbl in self._help_labels:
-                lbl.draw()
+            self._help_label.draw()
 
 
 # --- Main Application ---
@@ -663,8 +816,13 @@ class SoulStreamApp(pyglet.window.Window):
         self._state = STATE_LOADING
         self._float_keys_timer = 0.0
         self._float_keys_active = False
+        self._float_keys_last_alpha = -1
 
-        # Image source as primary
+        # Image source as primary. Imported here rather than at module
+        # scope (same pattern as the C-key camera import): image_source
+        # drags in cv2 and numba, so deferring it keeps the window
+        # opening fast
+        from image_source import ImageSource
         self.image_source = ImageSource(IMAGE_DIR, WIDTH, HEIGHT)
         self.use_camera = False
         self.camera = None  # Lazy-initialized on C key
@@ -675,6 +833,20 @@ class SoulStreamApp(pyglet.window.Window):
         self.overlay = SoulOverlay()
         self.sound = SoundManager()
         self._prev_palm_open = False
+        # Frame-coherent timestamp — read once per frame in on_draw and
+        # shared by every consumer (mode cycling, key handlers)
+        self._frame_now = time.monotonic()
+
+        # Async screenshot: GPU->PBO copy issued on demand, mapped a
+        # frame later, PNG encode/disk I/O on a worker thread
+        self._screenshot_pbo = None
+        self._pending_screenshot = None
+        self._screenshot_writer = ThreadPoolExecutor(max_workers=1)
+
+        # Resize coalescing: on_resize only records the size; the heavy
+        # relayout runs once per frame in on_draw
+        self._pending_resize = None
+        self._applied_size = (WIDTH, HEIGHT)
 
         # Load particle shaders
         with open(os.path.join(SHADER_DIR, "particle.vert")) as f:
@@ -683,29 +855,57 @@ class SoulStreamApp(pyglet.window.Window):
             frag_src = f.read()
         self._prog = self.ctx.program(vertex_shader=vert_src, fragment_shader=frag_src)
 
-        # GPU buffer — pre-allocate for max particles (7 floats each)
-        self._vbo = self.ctx.buffer(reserve=MAX_PARTICLES * 7 * 4)
-        self._vao = self.ctx.vertex_array(
-            self._prog,
-            [(self._vbo, "2f 3f 1f 1f", "in_pos", "in_color", "in_alpha", "in_size")],
-        )
+        # GPU buffers — a ring of three preallocated VBOs holding the
+        # packed 8-byte vertices (f16 pos, normalized u8 color and life
+        # ratio). Rotating the ring gives the driver the CPU/GPU
+        # separation orphan() used to fake, without reallocating: at
+        # depth 3 the GPU has finished with a slot long before we loop
+        # back to it under vsync. Each upload is a glBufferSubData-style
+        # write of just the live n*8 bytes (pack_gpu returns a sliced
+        # contiguous view), never the full reserve.
+        self._vbo_ring = [
+            self.ctx.buffer(reserve=MAX_PARTICLES * GPU_DTYPE.itemsize, dynamic=True)
+            for _ in range(3)
+        ]
+        self._vao_ring = [
+            self.ctx.vertex_array(
+                self._prog,
+                [(vbo, "2f2 3f1 1f1", "in_pos", "in_color", "in_ratio")],
+            )
+            for vbo in self._vbo_ring
+        ]
+        self._ring_idx = 0
 
+        # Debug HUD labels share one Batch — a debug frame issues one
+        # text draw call instead of four
+        self._hud_batch = pyglet.graphics.Batch()
         self._mode_label = pyglet.text.Label(
             "", font_name="Consolas", font_size=12,
             x=10, y=HEIGHT - 20, color=(180, 180, 180, 200),
+            batch=self._hud_batch,
         )
         self._particle_label = pyglet.text.Label(
             "", font_name="Consolas", font_size=12,
             x=10, y=HEIGHT - 40, color=(180, 180, 180, 200),
+            batch=self._hud_batch,
         )
         self._source_label = pyglet.text.Label(
             "", font_name="Consolas", font_size=12,
             x=10, y=HEIGHT - 60, color=(180, 180, 180, 200),
+            batch=self._hud_batch,
         )
         self._hand_label = pyglet.text.Label(
             "", font_name="Consolas", font_size=12,
             x=10, y=HEIGHT - 80, color=(180, 180, 180, 200),
+            batch=self._hud_batch,
         )
+        # Inputs behind each HUD line from the last frame — the text
+        # setter reshapes glyphs even for identical strings, so skip
+        # the f-string and the assignment while they're unchanged
+        self._hud_mode_key = None
+        self._hud_particles = -1
+        self._hud_source_key = None
+        self._hud_hand_key = None
 
         # Wall clock (bottom-right)
         self._clock_label = pyglet.text.Label(
@@ -715,6 +915,21 @@ class SoulStreamApp(pyglet.window.Window):
             color=(160, 150, 130, 180),
         )
         self._tz_name = datetime.now().astimezone().strftime("%Z")
+        # Refresh the clock string at 1 Hz instead of per frame — the
+        # draw path then only blits an already-laid-out label
+        self._update_clock(0.0)
+        pyglet.clock.schedule_interval(self._update_clock, 1.0)
+
+        # Fixed-timestep simulation, decoupled from the draw cadence:
+        # _simulate ticks at ~60 Hz advancing by real elapsed time, so
+        # a 30 fps stall or a 120 Hz display doesn't change simulation
+        # speed. on_draw only uploads the latest packed buffer.
+        self._sim_last = time.monotonic()
+        self._packed = None
+        self._packed_n = 0
+        self._packed_dirty = False
+        self._frame_hand = None
+        pyglet.clock.schedule_interval(self._simulate, 1.0 / 60.0)
 
         # GUI overlay menu
         self.menu = GameMenu(WIDTH, HEIGHT, callbacks={
@@ -731,11 +946,19 @@ class SoulStreamApp(pyglet.window.Window):
         })
 
         # --- Loading screen assets ---
+        # One Batch (bg sprite under dim rect under text) so the whole
+        # screen is a single draw call; disposed once the intro starts
+        self._loading_batch = pyglet.graphics.Batch()
+        grp_bg = pyglet.graphics.Group(order=0)
+        grp_dim = pyglet.graphics.Group(order=1)
+        grp_text = pyglet.graphics.Group(order=2)
+
         self._loading_bg_sprite = None
         try:
             bg_path = os.path.join(IMAGE_DIR, "darksouls1.jpg")
             bg_img = pyglet.image.load(bg_path)
-            self._loading_bg_sprite = pyglet.sprite.Sprite(bg_img)
+            self._loading_bg_sprite = pyglet.sprite.Sprite(
+                bg_img, batch=self._loading_batch, group=grp_bg)
             # Scale to fill window
             sx = WIDTH / bg_img.width
             sy = HEIGHT / bg_img.height
@@ -747,7 +970,9 @@ class SoulStreamApp(pyglet.window.Window):
             print(f"[Loading] Could not load background: {e}")
 
         # Dark overlay rectangle (reused every frame)
-        self._loading_overlay = pyglet.shapes.Rectangle(0, 0, WIDTH, HEIGHT, color=(0, 0, 0))
+        self._loading_overlay = pyglet.shapes.Rectangle(
+            0, 0, WIDTH, HEIGHT, color=(0, 0, 0),
+            batch=self._loading_batch, group=grp_dim)
         self._loading_overlay.opacity = 160
 
         self._loading_title = pyglet.text.Label(
@@ -755,50 +980,63 @@ class SoulStreamApp(pyglet.window.Window):
             x=WIDTH // 2, y=HEIGHT // 2 + 60,
             anchor_x="center", anchor_y="center",
             color=(200, 168, 78, 255),
+            batch=self._loading_batch, group=grp_text,
         )
         self._loading_subtitle = pyglet.text.Label(
             "by \u6eaf\u6d41\u5149", font_name="Georgia", font_size=22,
             x=WIDTH // 2, y=HEIGHT // 2 - 10,
             anchor_x="center", anchor_y="center",
             color=(230, 220, 200, 220),
+            batch=self._loading_batch, group=grp_text,
         )
         self._loading_version = pyglet.text.Label(
             "v1.0", font_name="Consolas", font_size=12,
             x=WIDTH // 2, y=40,
             anchor_x="center", anchor_y="center",
             color=(140, 130, 120, 160),
+            batch=self._loading_batch, group=grp_text,
         )
         self._loading_start = pyglet.text.Label(
             "PRESS ENTER", font_name="Georgia", font_size=20,
             x=WIDTH // 2, y=HEIGHT // 2 - 80,
             anchor_x="center", anchor_y="center",
             color=(200, 168, 78, 255),
+            batch=self._loading_batch, group=grp_text,
         )
         self._loading_time = 0.0
+        self._loading_last_pulse = -1
 
         # --- Intro floating key labels ---
-        self._intro_labels = []
+        # Animation state lives in SoA form (base positions and phases
+        # in parallel ndarrays, Label refs in a plain list — one np.sin
+        # per frame covers all keys, no per-key dict lookups); the
+        # labels share one Batch so they draw in one call
         n_keys = len(_INTRO_KEYS)
+        self._intro_batch = pyglet.graphics.Batch()
+        self._intro_labels = []
+        # Loose 3x2 grid as normalized window fractions — any layout
+        # (init or resize) is then one broadcast multiply by (w, h)
+        idx = np.arange(n_keys)
+        self._intro_uv = np.stack([0.2 + (idx % 3) * 0.3,
+                                   0.6 - (idx // 3) * 0.25], axis=1).astype("f4")
+        self._intro_base_xy = self._intro_uv * np.array((WIDTH, HEIGHT), dtype="f4")
+        self._intro_phase = np.arange(n_keys, dtype="f4") * 1.1
+        # Reused RGBA buffers (pyglet accepts any 4-sequence for
+        # Label.color) — fades mutate the alpha slot in place instead of
+        # allocating a tuple per label per frame
+        self._intro_rgba = [[r, g, b, 0] for _, _, (r, g, b) in _INTRO_KEYS]
         for i, (key_name, desc, color) in enumerate(_INTRO_KEYS):
-            # Scatter across screen in a loose 3x2 grid
-            col = i % 3
-            row = i // 3
-            lx = int(WIDTH * (0.2 + col * 0.3))
-            ly = int(HEIGHT * (0.6 - row * 0.25))
+            lx = int(self._intro_base_xy[i, 0])
+            ly = int(self._intro_base_xy[i, 1])
             lbl = pyglet.text.Label(
                 f"  [{key_name}]  {desc}  ",
                 font_name="Consolas", font_size=16,
                 x=lx, y=ly,
                 anchor_x="center", anchor_y="center",
                 color=(*color, 0),
+                batch=self._intro_batch,
             )
-            self._intro_labels.append({
-                "label": lbl,
-                "base_x": lx,
-                "base_y": ly,
-                "color": color,
-                "phase": i * 1.1,  # different sinusoidal phase per key
-            })
+            self._intro_labels.append(lbl)
 
     # ── GUI menu callbacks ──────────────────────────────────
 
@@ -824,7 +1062,7 @@ class SoulStreamApp(pyglet.window.Window):
 
     def _gui_set_mode(self, mode):
         self.mode_ctrl.mode = mode
-        self.mode_ctrl._cycle_start = time.monotonic()
+        self.mode_ctrl._cycle_start = self._frame_now
         self.sound.play(AUDIO_MODE_CYCLE)
 
     def _gui_set_volume(self, value):
@@ -839,18 +1077,53 @@ class SoulStreamApp(pyglet.window.Window):
         self.sound.play(AUDIO_HELP, volume=0.40)
 
     def _save_screenshot(self):
-        """Save current frame to result/ with auto-generated name."""
-        os.makedirs(RESULT_DIR, exist_ok=True)
+        """Queue a screenshot of the current frame (async PBO readback)."""
         mode = MODE_NAMES[self.mode_ctrl.mode].split()[0].lower()  # auto/humanity/ember
         state = "ember" if self.mode_ctrl.is_ember else "humanity"
         source = "cam" if self.use_camera else self.image_source.image_name.rsplit(".", 1)[0]
-        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{stamp}_{source}_{mode}_{state}.png"
-        path = os.path.join(RESULT_DIR, filename)
-        pyglet.image.get_buffer_manager().get_color_buffer().save(path)
-        print(f"[Screenshot] Saved: {path}")
+
+        # Copy the framebuffer into a pixel-pack buffer instead of a
+        # synchronous glReadPixels to host memory — the GPU copy is
+        # async, and the map happens a frame later when it has retired.
+        # Rapid presses before the flush coalesce into the last request.
+        # Name formatting and makedirs happen on the writer thread; only
+        # the request time is captured here.
+        w, h = self.get_framebuffer_size()
+        size = w * h * 4
+        if self._screenshot_pbo is None or self._screenshot_pbo.size != size:
+            self._screenshot_pbo = self.ctx.buffer(reserve=size)
+        self.ctx.screen.read_into(self._screenshot_pbo, components=4)
+        self._pending_screenshot = (f"{source}_{mode}_{state}", time.time(), w, h)
         self.overlay.trigger_banner("SCREENSHOT SAVED", (180, 200, 220))
 
+    def _flush_screenshot(self):
+        """One frame after the readback was issued: map the PBO and hand
+        the pixels to the writer thread for PNG encode + disk I/O."""
+        suffix, ts, w, h = self._pending_screenshot
+        self._pending_screenshot = None
+        data = self._screenshot_pbo.read()
+        self._screenshot_writer.submit(self._write_screenshot, suffix, ts, w, h, data)
+
+    @staticmethod
+    def _write_screenshot(suffix, ts, w, h, data):
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(ts))
+        path = os.path.join(RESULT_DIR, f"{stamp}_{suffix}.png")
+        try:
+            os.makedirs(RESULT_DIR, exist_ok=True)
+            img = pyglet.image.ImageData(w, h, "RGBA", data, pitch=w * 4)
+            img.save(path)
+            print(f"[Screenshot] Saved: {path}")
+        except Exception as e:
+            print(f"[Screenshot] Failed to save '{path}': {e}")
+
+    def _update_clock(self, dt):
+        """1 Hz clock refresh — keeps datetime/strftime off the frame path."""
+        text = f"{datetime.now().strftime('%H:%M:%S')}  {self._tz_name}"
+        # Scheduler jitter can fire twice within one second; skip the
+        # glyph relayout when the text hasn't ticked over
+        if text != self._clock_label.text:
+            self._clock_label.text = text
+
     def _gui_quit(self):
         dur = self.sound.play_quit()
         self.sound.cleanup()
@@ -859,6 +1132,7 @@ class SoulStreamApp(pyglet.window.Window):
     def _transition_to_intro(self):
         """Transition from loading screen to intro state."""
         self._state = STATE_INTRO
+        self._dispose_loading()
         self._show_float_keys()
         self.sound.play(AUDIO_START)
         self.sound.start_ambience()
@@ -899,7 +1173,7 @@ class SoulStreamApp(pyglet.window.Window):
         elif symbol == key.D:
             self.debug.enabled = not self.debug.enabled
         elif symbol == key.SPACE:
-            self.mode_ctrl.cycle()
+            self.mode_ctrl.cycle(self._frame_now)
             self.sound.play(AUDIO_MODE_CYCLE)
         elif symbol == key.C:
             # Toggle camera mode (lazy-init webcam)
@@ -949,8 +1223,19 @@ class SoulStreamApp(pyglet.window.Window):
         self.menu.on_mouse_release(x, y)
 
     def on_resize(self, width, height):
+        # Only the viewport must track every event; the label/menu
+        # rework is coalesced and applied at most once per frame from
+        # on_draw (a window drag fires bursts of resize events)
         super().on_resize(width, height)
         self.ctx.viewport = (0, 0, width, height)
+        self._pending_resize = (width, height)
+
+    def _apply_resize(self):
+        width, height = self._pending_resize
+        self._pending_resize = None
+        if (width, height) == self._applied_size:
+            return
+        self._applied_size = (width, height)
 
         # Update overlay / debug positions for new dimensions
         self.overlay.resize(width, height)
@@ -965,35 +1250,32 @@ class SoulStreamApp(pyglet.window.Window):
         # Reposition clock
         self._clock_label.x = width - 10
 
-        # Reposition loading screen
-        if self._loading_bg_sprite:
-            img = self._loading_bg_sprite.image
-            sx = width / img.width
-            sy = height / img.height
-            scale = max(sx, sy)
-            self._loading_bg_sprite.scale = scale
-            self._loading_bg_sprite.x = (width - img.width * scale) / 2
-            self._loading_bg_sprite.y = (height - img.height * scale) / 2
-        self._loading_overlay.width = width
-        self._loading_overlay.height = height
-        self._loading_title.x = width // 2
-        self._loading_title.y = height // 2 + 60
-        self._loading_subtitle.x = width // 2
-        self._loading_subtitle.y = height // 2 - 10
-        self._loading_version.x = width // 2
-        self._loading_start.x = width // 2
-        self._loading_start.y = height // 2 - 80
-
-        # Reposition intro floating key labels
-        for i, entry in enumerate(self._intro_labels):
-            col = i % 3
-            row = i // 3
-            lx = int(width * (0.2 + col * 0.3))
-            ly = int(height * (0.6 - row * 0.25))
-            entry["base_x"] = lx
-            entry["base_y"] = ly
-            entry["label"].x = lx
-            entry["label"].y = ly
+        # Reposition loading screen (skipped once disposed)
+        if self._loading_batch is not None:
+            if self._loading_bg_sprite:
+                img = self._loading_bg_sprite.image
+                sx = width / img.width
+                sy = height / img.height
+                scale = max(sx, sy)
+                self._loading_bg_sprite.scale = scale
+                self._loading_bg_sprite.x = (width - img.width * scale) / 2
+                self._loading_bg_sprite.y = (height - img.height * scale) / 2
+            self._loading_overlay.width = width
+            self._loading_overlay.height = height
+            self._loading_title.x = width // 2
+            self._loading_title.y = height // 2 + 60
+            self._loading_subtitle.x = width // 2
+            self._loading_subtitle.y = height // 2 - 10
+            self._loading_version.x = width // 2
+            self._loading_start.x = width // 2
+            self._loading_start.y = height // 2 - 80
+
+        # Reposition intro floating key labels — one broadcast rescales
+        # the whole grid; the loop only hands results to pyglet
+        self._intro_base_xy[:] = self._intro_uv * np.array((width, height), dtype="f4")
+        for lbl, (lx, ly) in zip(self._intro_labels, self._intro_base_xy):
+            lbl.x = int(lx)
+            lbl.y = int(ly)
 
         # Recreate the GUI menu at the new dimensions
         self.menu = GameMenu(width, height, callbacks={
@@ -1015,29 +1297,36 @@ class SoulStreamApp(pyglet.window.Window):
 
     def _draw_loading(self, dt):
         """Draw the loading/title screen."""
+        if self._loading_batch is None:
+            return
         self._loading_time += dt
 
-        # Draw background image scaled to fill window
-        if self._loading_bg_sprite:
-            self._loading_bg_sprite.draw()
-
-        # Dark overlay for readability
-        self._loading_overlay.draw()
-
-        # Title, subtitle, version
-        self._loading_title.draw()
-        self._loading_subtitle.draw()
-        self._loading_version.draw()
-
-        # Pulsing "PRESS ENTER" text
-        pulse = int((math.sin(self._loading_time * 2.5) * 0.5 + 0.5) * 255)
-        self._loading_start.color = (200, 168, 78, pulse)
-        self._loading_start.draw()
+        # Pulsing "PRESS ENTER" text; everything else is static. The
+        # pulse is quantized to 32 steps so the label's vertex list is
+        # only dirtied when the step actually moves (~13 color writes
+        # per second instead of 60, invisible at this fade rate).
+        pulse = int((math.sin(self._loading_time * 2.5) * 0.5 + 0.5) * 31) * 8
+        if pulse != self._loading_last_pulse:
+            self._loading_start.color = (200, 168, 78, pulse)
+            self._loading_last_pulse = pulse
+        self._loading_batch.draw()
+
+    def _dispose_loading(self):
+        """Free the loading-screen sprite/labels once the intro starts —
+        the background texture alone is a few MB that is never shown again."""
+        for attr in ("_loading_bg_sprite", "_loading_overlay", "_loading_title",
+                     "_loading_subtitle", "_loading_version", "_loading_start"):
+            obj = getattr(self, attr)
+            if obj is not None:
+                obj.delete()
+            setattr(self, attr, None)
+        self._loading_batch = None
 
     def _show_float_keys(self):
         """Start (or restart) the floating key help animation."""
         self._float_keys_timer = 0.0
         self._float_keys_active = True
+        self._float_keys_last_alpha = -1
 
     def _draw_float_keys(self, dt):
         """Draw floating key labels with fade and drift. Returns True while active."""
@@ -1058,55 +1347,57 @@ class SoulStreamApp(pyglet.window.Window):
             self._float_keys_active = False
             return False
 
-        for entry in self._intro_labels:
-            lbl = entry["label"]
-            r, g, b = entry["color"]
-            y_offset = math.sin(t * 1.5 + entry["phase"]) * 12.0
-            lbl.x = entry["base_x"]
-            lbl.y = int(entry["base_y"] + y_offset)
-            lbl.color = (r, g, b, int(alpha_factor * 230))
-            lbl.draw()
+        # One vectorized sin evaluates every key's bob at once — the
+        # per-label Python work is just handing results to pyglet, which
+        # has no array API for label attributes
+        y = self._intro_base_xy[:, 1] + np.sin(t * 1.5 + self._intro_phase) * 12.0
+        alpha = int(alpha_factor * 230)
+        # Colors only change while fading — the 1-4s plateau holds alpha
+        update_color = alpha != self._float_keys_last_alpha
+        for i, lbl in enumerate(self._intro_labels):
+            lbl.y = int(y[i])
+            if update_color:
+                rgba = self._intro_rgba[i]
+                rgba[3] = alpha
+                lbl.color = rgba
+        self._float_keys_last_alpha = alpha
+        self._intro_batch.draw()
         return True
 
     def _draw_intro(self, dt):
         """Draw particle system + floating help keys during intro."""
-        # Run the normal particle simulation
-        now = time.monotonic()
-        self.mode_ctrl.update_image(now)
-        self.particles.spawn(self.image_source, self.mode_ctrl.is_ember)
-        self.particles.update(dt, self.mode_ctrl.is_ember)
-        self.sound.update(self.mode_ctrl.is_ember)
-
-        gpu_data = self.particles.pack_gpu()
-        n = self.particles.count
-        if n > 0:
-            data_bytes = gpu_data.tobytes()
-            self._vbo.orphan()
-            self._vbo.write(data_bytes)
-            self._vao.render(moderngl.POINTS, vertices=n)
+        self._render_particles()
 
         # Draw floating keys; transition when done
         if not self._draw_float_keys(dt):
             self._state = STATE_RUNNING
 
-    def on_draw(self):
-        self.ctx.clear(0.0, 0.0, 0.0, 1.0)
-
-        dt = 1.0 / 60.0
-
-        if self._state == STATE_LOADING:
-            self._draw_loading(dt)
-            return
+    def _simulate(self, dt):
+        """Fixed-timestep simulation tick (scheduled at ~60 Hz).
 
-        if self._state == STATE_INTRO:
-            self._draw_intro(dt)
+        Mode logic, spawning, particle integration and GPU packing run
+        here — off the draw callback — advancing by real elapsed time,
+        so the sim neither slows on a stalled display nor double-runs
+        on a fast one.
+        """
+        now = time.monotonic()
+        # Nothing to simulate before the intro; while minimized, idle
+        # the sim too (keeping _sim_last fresh so restoring the window
+        # doesn't integrate the away-time as one step)
+        if self._state == STATE_LOADING or not self.visible:
+            self._sim_last = now
             return
 
-        # --- STATE_RUNNING (original logic) ---
-        now = time.monotonic()
+        # Real elapsed time, clamped so a long stall (window drag,
+        # vsync hiccup) doesn't integrate one giant step
+        real_dt = min(now - self._sim_last, 0.1)
+        self._sim_last = now
 
-        if self.use_camera and self.camera:
-            # Camera path: motion-based mode switching + hand gestures
+        hand_data = None
+        if self._state == STATE_RUNNING and self.use_camera and self.camera:
+            # Camera path: motion-based mode switching + hand gestures.
+            # One hand snapshot per tick — get_hand_data takes the
+            # camera lock, and every consumer should agree on one frame
             brightness, motion, avg_motion = self.camera.get_data()
             hand_data = self.camera.get_hand_data()
             self.mode_ctrl.update_camera(avg_motion, now, hand_data.is_open_palm)
@@ -1121,72 +1412,142 @@ class SoulStreamApp(pyglet.window.Window):
             else:
                 self._prev_palm_open = False
         else:
-            # Image path: time-based mode cycling
+            # Image path (also covers the intro): time-based mode cycling
             self.mode_ctrl.update_image(now)
             self.particles.spawn(self.image_source, self.mode_ctrl.is_ember)
 
-        self.particles.update(dt, self.mode_ctrl.is_ember)
+        self.particles.update(real_dt, self.mode_ctrl.is_ember)
         self.sound.update(self.mode_ctrl.is_ember)
+        if self._state == STATE_RUNNING:
+            # Banner/quote timers and their transition detectors advance
+            # with the sim, not the display — a 144 Hz refresh doesn't
+            # spin them any faster (drawing stays in on_draw)
+            image_name = None if self.use_camera else self.image_source.image_name
+            self.overlay.update(real_dt, self.mode_ctrl.is_ember, image_name)
+        self._frame_hand = hand_data
+
+        self._packed = self.particles.pack_gpu()
+        self._packed_n = self.particles.count
+        self._packed_dirty = True
+
+    def _render_particles(self):
+        """Upload the latest packed buffer (if new) and render it.
+
+        Writes go to the next slot of the 3-deep VBO ring (each with a
+        prebuilt VAO), so the CPU fills one buffer while the GPU still
+        reads the previous frame's — no implicit write-after-draw sync.
+        """
+        n = self._packed_n
+        if n == 0:
+            return
+        if self._packed_dirty:
+            # Only advance the ring and re-upload when the sim actually
+            # produced new data — extra draws just replay the last slot
+            self._ring_idx = (self._ring_idx + 1) % 3
+            self._vbo_ring[self._ring_idx].write(self._packed)
+            self._packed_dirty = False
+        self._vao_ring[self._ring_idx].render(moderngl.POINTS, vertices=n)
+
+    def on_draw(self):
+        # Minimized/hidden windows can still receive draw callbacks
+        # with a degenerate viewport — skip everything until restored
+        if self.width == 0 or self.height == 0 or not self.visible:
+            return
+
+        # Drain last frame's screenshot readback before rendering — by
+        # now the GPU copy has retired, so the map doesn't stall
+        if self._pending_screenshot is not None:
+            self._flush_screenshot()
+        if self._pending_resize is not None:
+            self._apply_resize()
+
+        self.ctx.clear(0.0, 0.0, 0.0, 1.0)
 
-        # Pack and upload to GPU
-        gpu_data = self.particles.pack_gpu()
-        n = self.particles.count
-        if n > 0:
-            data_bytes = gpu_data.tobytes()
-            self._vbo.orphan()
-            self._vbo.write(data_bytes)
-            self._vao.render(moderngl.POINTS, vertices=n)
+        # Single clock read per frame, shared by all consumers. The
+        # draw-side animations (fades, pulses, key bobbing) advance by
+        # the real frame interval — clamped like the sim tick — so
+        # their speed no longer assumes a 60 Hz refresh.
+        now = time.monotonic()
+        dt = min(now - self._frame_now, 0.1)
+        self._frame_now = now
+
+        if self._state == STATE_LOADING:
+            self._draw_loading(dt)
+            return
+
+        if self._state == STATE_INTRO:
+            self._draw_intro(dt)
+            return
+
+        # --- STATE_RUNNING: render what the sim tick produced ---
+        # The sim's hand snapshot is reused for every HUD consumer —
+        # the draw path never makes its own camera round-trip
+        hand_data = self._frame_hand
+        self._render_particles()
 
         # Debug overlay + HUD
         if self.debug.enabled:
             if self.use_camera and self.camera:
-                preview = self.camera.get_preview()
-                hand_data_dbg = self.camera.get_hand_data()
+                seq, preview = self.camera.get_preview()
             else:
-                preview = self.image_source.get_preview()
-                hand_data_dbg = None
-            self.debug.draw(preview)
-            if hand_data_dbg is not None:
-                self.debug.draw_hand(hand_data_dbg)
-
-            mode_name = MODE_NAMES[self.mode_ctrl.mode]
-            state = "EMBER" if self.mode_ctrl.is_ember else "Humanity"
-            source = "Camera" if self.use_camera else f"Image: {self.image_source.image_name}"
-            self._mode_label.text = f"Mode: {mode_name} | State: {state}"
-            self._mode_label.draw()
-            self._particle_label.text = f"Particles: {self.particles.count}"
-            self._particle_label.draw()
-            self._source_label.text = f"Source: {source} [{self.image_source.image_count} images]"
-            self._source_label.draw()
+                seq, preview = self.image_source.get_preview()
+            # Source flag keeps camera/image counters from colliding
+            self.debug.draw(preview, (self.use_camera, seq))
+            if hand_data is not None:
+                self.debug.draw_hand(hand_data)
+
+            mode_key = (self.mode_ctrl.mode, self.mode_ctrl.is_ember)
+            if mode_key != self._hud_mode_key:
+                mode_name = MODE_NAMES[self.mode_ctrl.mode]
+                state = "EMBER" if self.mode_ctrl.is_ember else "Humanity"
+                self._mode_label.text = f"Mode: {mode_name} | State: {state}"
+                self._hud_mode_key = mode_key
+            if self.particles.count != self._hud_particles:
+                self._particle_label.text = f"Particles: {self.particles.count}"
+                self._hud_particles = self.particles.count
+            source_key = (self.use_camera, self.image_source.image_name,
+                          self.image_source.image_count)
+            if source_key != self._hud_source_key:
+                source = "Camera" if self.use_camera else f"Image: {self.image_source.image_name}"
+                self._source_label.text = f"Source: {source} [{self.image_source.image_count} images]"
+                self._hud_source_key = source_key
 
             # Hand tracking debug panel (bottom-right: skeleton + finger status)
-            if self.use_camera and self.camera:
-                hand_data_panel = self.camera.get_hand_data()
+            if hand_data is not None:
                 ema = self.camera.get_hand_ema()
-                self.debug.draw_hand_panel(hand_data_panel, ema)
-
-                # Top-left summary line
-                if hand_data_panel.detected:
-                    palm_state = "OPEN PALM" if hand_data_panel.is_open_palm else "CLOSED"
-                    self._hand_label.text = (
-                        f"Hand: {palm_state} | Palm NDC: "
-                        f"({hand_data_panel.palm_ndc_x:.2f}, {hand_data_panel.palm_ndc_y:.2f})"
-                    )
-                else:
+                self.debug.draw_hand_panel(hand_data, ema)
+
+                # Top-left summary line (palm NDC keyed at the same
+                # precision the text shows, so sub-0.01 jitter is free)
+                if hand_data.detected:
+                    hand_key = (hand_data.is_open_palm,
+                                round(hand_data.palm_ndc_x, 2),
+                                round(hand_data.palm_ndc_y, 2))
+                    if hand_key != self._hud_hand_key:
+                        palm_state = "OPEN PALM" if hand_data.is_open_palm else "CLOSED"
+                        self._hand_label.text = (
+                            f"Hand: {palm_state} | Palm NDC: "
+                            f"({hand_data.palm_ndc_x:.2f}, {hand_data.palm_ndc_y:.2f})"
+                        )
+                        self._hud_hand_key = hand_key
+                elif self._hud_hand_key != "none":
                     self._hand_label.text = "Hand: not detected"
-                self._hand_label.draw()
+                    self._hud_hand_key = "none"
+            elif self._hud_hand_key is not None:
+                # Batched labels always render — blank the camera-only line
+                self._hand_label.text = ""
+                self._hud_hand_key = None
 
-        # Soul overlay (banners, quotes)
-        image_name = None if self.use_camera else self.image_source.image_name
-        self.overlay.update(dt, self.mode_ctrl.is_ember, image_name)
+            self._hud_batch.draw()
+
+        # Soul overlay (banners, quotes) — timers advance in _simulate
         self.overlay.draw()
 
         # Floating key help (triggered by H key)
         self._draw_float_keys(dt)
 
-        # Wall clock (bottom-right)
-        now_str = datetime.now().strftime("%H:%M:%S")
-        self._clock_label.text = f"{now_str}  {self._tz_name}"
+        # Wall clock (bottom-right) — text is refreshed by the 1 Hz
+        # _update_clock callback, not here
         self._clock_label.draw()
 
         # GUI menu overlay — always last (on top of everything)
@@ -1194,12 +1555,15 @@ class SoulStreamApp(pyglet.window.Window):
 
     def on_close(self):
         self.sound.cleanup()
+        # Let any in-flight screenshot finish writing to disk
+        self._screenshot_writer.shutdown(wait=True)
         super().on_close()
 
 
 def main():
+    # The app schedules its own real callbacks (_simulate, _update_clock);
+    # no dummy tick is needed to keep pyglet's clock serviced
     app = SoulStreamApp()
-    pyglet.clock.schedule_interval(lambda dt: None, 1 / 60)
     pyglet.app.run()
 
 
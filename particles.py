@@ -1,100 +1,282 @@
+import math
+
 import numpy as np
+from numba import njit, prange
 
 MAX_PARTICLES = 25000
 SPAWN_PER_FRAME = 150
 
+# Packed GPU vertex: half-float position, normalized uint8 color and
+# life ratio — 8 bytes per particle instead of the 28 a full-float
+# layout costs. Alpha and point size are pure functions of the life
+# ratio, so the vertex shader derives them on the GPU instead of the
+# CPU computing and uploading them. Matches the "2f2 3f1 1f1" moderngl
+# attribute format.
+GPU_DTYPE = np.dtype([
+    ("pos", "<f2", 2),
+    ("color", "u1", 3),
+    ("ratio", "u1"),
+])
+
+
+@njit(fastmath=True, nogil=True, cache=True)
+def _ember_colors(cr, cg, cb, roll, out_r, out_g, out_b):
+    """Fused ember color pipeline: warm shift + spark override.
+
+    One scalar pass per spawned particle instead of the chain of
+    temporary-allocating array ops it replaces (minimum, two nested
+    wheres) — at n~150 that chain was allocator-bound, not math-bound.
+    """
+    for i in range(cr.shape[0]):
+        if roll[i] < 0.08:
+            # White-gold spark
+            out_r[i] = 1.0
+            out_g[i] = 0.9
+            out_b[i] = 0.6
+        else:
+            r = cr[i] * 1.3 + 0.1
+            out_r[i] = 1.0 if r > 1.0 else r
+            out_g[i] = cg[i] * 0.8
+            out_b[i] = cb[i] * 0.3
+
+
+@njit(fastmath=True, nogil=True, cache=True)
+def _humanity_colors(cr, cg, cb, desat, roll, out_r, out_g, out_b):
+    """Fused humanity color pipeline: desaturate toward luminance,
+    boost dark pixels, magenta/indigo accent overrides.
+
+    A single `roll` draw serves both accent picks via threshold bands
+    ([0, 0.03) magenta, [0.03, 0.06) indigo) — only `desat`, being a
+    continuous independent variate, needs its own draw.
+    """
+    for i in range(cr.shape[0]):
+        if roll[i] < 0.03:
+            # Magenta accent
+            out_r[i] = 1.0
+            out_g[i] = 0.0
+            out_b[i] = 1.0
+        elif roll[i] < 0.06:
+            # Indigo accent
+            out_r[i] = 0.29
+            out_g[i] = 0.0
+            out_b[i] = 0.51
+        else:
+            lum = 0.299 * cr[i] + 0.587 * cg[i] + 0.114 * cb[i]
+            d = desat[i]
+            r = cr[i] * (1.0 - d) + lum * d
+            g = cg[i] * (1.0 - d) + lum * d
+            b = cb[i] * (1.0 - d) + lum * d
+            out_r[i] = r if r > 0.15 else 0.15
+            out_g[i] = g if g > 0.15 else 0.15
+            out_b[i] = b if b > 0.15 else 0.15
+
+
+@njit(parallel=True, fastmath=True, nogil=True, cache=True,
+      boundscheck=False)
+def _update_kernel(pos_x, pos_y, vel_x, vel_y, life, sph, cph,
+                   st, ct, wobble_amp, dt):
+    """Fused per-frame integration: wobble, position, life decrement.
+
+    One multi-threaded streaming pass over the live rows instead of
+    four separate NumPy dispatches — with fastmath and no bounds
+    checks, LLVM auto-vectorizes the loop body, so this is already the
+    native-SIMD rung without leaving the all-Numba toolchain. `st`/`ct`
+    are sin/cos of the wobble clock, combined with the stored
+    per-particle phase pair via the angle-addition identity. Returns
+    the dead count so the caller can decide whether compaction is due
+    without another full mask pass.
+    """
+    dead = 0
+    for i in prange(pos_x.shape[0]):
+        w = (st * cph[i] + ct * sph[i]) * wobble_amp
+        pos_x[i] += (vel_x[i] + w) * dt
+        pos_y[i] += vel_y[i] * dt
+        life[i] -= dt
+        if life[i] <= 0.0:
+            dead += 1
+    return dead
+
+
+@njit(parallel=True, fastmath=True, nogil=True, cache=True)
+def _fire_gradient(pos_x, pos_y, px, py, out_r, out_g, out_b):
+    """Fused palm-distance + hermite fire recolor over all live particles.
+
+    Near the palm (t=0): yellow (1.0, 1.0, 0.0); far (t=1): deep red
+    (1.0, 0.27, 0.0), g = 1 - 0.73*(3t^2 - 2t^3). One read of each
+    position and one write per channel — and since t clamps at 1, the
+    sqrt is skipped entirely once the squared distance reaches 1.
+    """
+    for i in prange(pos_x.shape[0]):
+        dx = pos_x[i] - px
+        dy = pos_y[i] - py
+        d2 = dx * dx + dy * dy
+        if d2 >= 1.0:
+            g = 0.27
+        else:
+            t = math.sqrt(d2)
+            g = 1.0 - 0.73 * (3.0 * t * t - 2.0 * t * t * t)
+        out_r[i] = 1.0
+        out_g[i] = g
+        out_b[i] = 0.0
+
+
+# Webcam-path dependencies, resolved on first spawn_camera call and
+# cached — importing camera/image_source at module scope would drag
+# cv2 (and mediapipe behind it) into startup for a mode that may never
+# be toggled on.
+_CAPTURE_W = _CAPTURE_H = 0
+_build_alias = _alias_sample = None
+
+
+def _resolve_camera_deps():
+    global _CAPTURE_W, _CAPTURE_H, _build_alias, _alias_sample
+    from camera import CAPTURE_W, CAPTURE_H
+    from image_source import build_alias, alias_sample
+    _CAPTURE_W, _CAPTURE_H = CAPTURE_W, CAPTURE_H
+    _build_alias, _alias_sample = build_alias, alias_sample
+
 
 class ParticleSystem:
     def __init__(self):
         self.count = 0
-        self.pos_x = np.zeros(MAX_PARTICLES, dtype=np.float32)
-        self.pos_y = np.zeros(MAX_PARTICLES, dtype=np.float32)
-        self.vel_x = np.zeros(MAX_PARTICLES, dtype=np.float32)
-        self.vel_y = np.zeros(MAX_PARTICLES, dtype=np.float32)
-        self.life = np.zeros(MAX_PARTICLES, dtype=np.float32)
-        self.max_life = np.ones(MAX_PARTICLES, dtype=np.float32)
-        self.color_r = np.zeros(MAX_PARTICLES, dtype=np.float32)
-        self.color_g = np.zeros(MAX_PARTICLES, dtype=np.float32)
-        self.color_b = np.zeros(MAX_PARTICLES, dtype=np.float32)
-        self._phase = np.zeros(MAX_PARTICLES, dtype=np.float32)
+        # One contiguous (field, particle) block — still SoA along the
+        # particle axis, but compaction and bulk moves become a single
+        # fancy-index on self._data instead of ten separate dispatches.
+        # The named attributes are row views into the same storage.
+        # Colors stay float32 here even though they upload as u8: the
+        # spawn/recolor kernels blend them in float, and a mixed-dtype
+        # layout would break the one-block compaction gather.
+        # Quantization happens once, in pack_gpu.
+        self._data = np.zeros((11, MAX_PARTICLES), dtype=np.float32)
+        (self.pos_x, self.pos_y, self.vel_x, self.vel_y,
+         self.life, self.max_life, self.color_r, self.color_g,
+         self.color_b, self._sph, self._cph) = self._data
+        self.max_life[:] = 1.0
+        self._gpu_buf = np.empty(MAX_PARTICLES, dtype=GPU_DTYPE)
+        self._ratio_buf = np.empty(MAX_PARTICLES, dtype=np.float32)
         self._time = 0.0
 
+        # Per-instance PCG64 generator (as in ImageSource) plus scratch
+        # rows for uniforms that aren't stored raw — everything that IS
+        # stored (velocities, life) is filled straight into its
+        # destination slice, so spawn allocates nothing per call
+        self._rng = np.random.default_rng()
+        self._scratch = np.empty((4, SPAWN_PER_FRAME), dtype=np.float32)
+        self._mask_scratch = np.empty((2, SPAWN_PER_FRAME), dtype=np.bool_)
+        self._idx_buf = np.empty(SPAWN_PER_FRAME, dtype=np.int32)
+        # Camera spawn-weight workspace, lazily shaped to the capture grid
+        self._cam_weights = None
+
+        # Warm-start the JIT so the first spawn doesn't pay compile time
+        z = np.zeros(1, dtype=np.float32)
+        o = np.empty(3, dtype=np.float32)
+        _ember_colors(z, z, z, z, o[0:1], o[1:2], o[2:3])
+        _humanity_colors(z, z, z, z, z, o[0:1], o[1:2], o[2:3])
+        _fire_gradient(z, z, np.float32(0.0), np.float32(0.0),
+                       o[0:1], o[1:2], o[2:3])
+        f0 = np.float32(0.0)
+        _update_kernel(o[0:1], o[1:2], z, z, o[2:3], z, z, f0, f0, f0, f0)
+
+    def _fill_uniform(self, out, lo, hi):
+        """Fill `out` in place with uniforms in [lo, hi) and return it —
+        no fresh array per draw, unlike np.random.uniform."""
+        self._rng.random(out=out, dtype=np.float32)
+        out *= (hi - lo)
+        out += lo
+        return out
+
+    def _roll_wobble_phase(self, s, e, n):
+        """Draw random wobble phases and store their sin/cos pair.
+
+        Paying two transcendental passes per spawn batch here lets
+        update() expand sin(t + phase) with the angle-addition identity
+        — two scalar sin/cos per frame instead of an n-vector np.sin.
+        """
+        ph = self._fill_uniform(self._scratch[2, :n], 0.0, 2.0 * np.pi)
+        np.sin(ph, out=self._sph[s:e])
+        np.cos(ph, out=self._cph[s:e])
+
     def spawn(self, image_source, is_ember):
+        """Thin dispatch to the mode-specialized spawn paths."""
+        if is_ember:
+            self._spawn_ember(image_source)
+        else:
+            self._spawn_humanity(image_source)
+
+    def _spawn_prologue(self, image_source):
+        """Shared spawn setup: sample grid cells, write NDC positions.
+
+        Returns (n, s, e, cr, cg, cb) for the claimed slice, or None
+        when the pool is full.
+        """
         slots = MAX_PARTICLES - self.count
         if slots <= 0:
-            return
+            return None
 
         n = min(SPAWN_PER_FRAME, slots)
 
-        # Sample grid positions from image source
+        # Sample grid positions, convert to NDC with sub-cell jitter,
+        # and pull the base colors from the image
         gy, gx = image_source.get_spawn_indices(n)
-
-        # Convert to NDC with sub-cell jitter
         nx, ny = image_source.grid_to_ndc(gy, gx)
-
-        # Sample base colors from the image
         cr, cg, cb = image_source.sample_colors(gy, gx)
 
         s = self.count
         e = s + n
-
         self.pos_x[s:e] = nx
         self.pos_y[s:e] = ny
+        return n, s, e, cr, cg, cb
 
-        if is_ember:
-            # Ember mode: warm-shift colors
-            self.vel_x[s:e] = np.random.uniform(-0.06, 0.06, n).astype(np.float32)
-            self.vel_y[s:e] = np.random.uniform(0.02, 0.12, n).astype(np.float32)
-
-            # Warm-shift: boost R, reduce B
-            cr_mod = np.minimum(cr * 1.3 + 0.1, 1.0)
-            cg_mod = cg * 0.8
-            cb_mod = cb * 0.3
-
-            # 8% white-gold spark chance
-            spark = np.random.uniform(0.0, 1.0, n) < 0.08
-            self.color_r[s:e] = np.where(spark, 1.0, cr_mod)
-            self.color_g[s:e] = np.where(spark, 0.9, cg_mod)
-            self.color_b[s:e] = np.where(spark, 0.6, cb_mod)
-
-            life_vals = np.random.uniform(1.5, 3.0, n).astype(np.float32)
-        else:
-            # Humanity mode: desaturate colors
-            self.vel_x[s:e] = np.random.uniform(-0.01, 0.01, n).astype(np.float32)
-            self.vel_y[s:e] = np.random.uniform(0.005, 0.025, n).astype(np.float32)
+    def _spawn_ember(self, image_source):
+        """Ember spawn: warm-shift colors, 8% white-gold sparks — the
+        color pipeline runs fused in _ember_colors."""
+        claimed = self._spawn_prologue(image_source)
+        if claimed is None:
+            return
+        n, s, e, cr, cg, cb = claimed
 
-            # Desaturate 50-80% toward luminance
-            lum = 0.299 * cr + 0.587 * cg + 0.114 * cb
-            desat = np.random.uniform(0.5, 0.8, n).astype(np.float32)
-            cr_mod = cr * (1.0 - desat) + lum * desat
-            cg_mod = cg * (1.0 - desat) + lum * desat
-            cb_mod = cb * (1.0 - desat) + lum * desat
+        self._fill_uniform(self.vel_x[s:e], -0.06, 0.06)
+        self._fill_uniform(self.vel_y[s:e], 0.02, 0.12)
 
-            # Boost dark pixels
-            cr_mod = np.maximum(cr_mod, 0.15)
-            cg_mod = np.maximum(cg_mod, 0.15)
-            cb_mod = np.maximum(cb_mod, 0.15)
+        roll = self._scratch[0, :n]
+        self._rng.random(out=roll, dtype=np.float32)
+        _ember_colors(cr, cg, cb, roll,
+                      self.color_r[s:e], self.color_g[s:e], self.color_b[s:e])
 
-            # 3% magenta accent, 3% indigo accent
-            roll = np.random.uniform(0.0, 1.0, n)
-            magenta = roll < 0.03
-            indigo = (roll >= 0.03) & (roll < 0.06)
+        self._fill_uniform(self.life[s:e], 1.5, 3.0)
+        self.max_life[s:e] = self.life[s:e]
+        self._roll_wobble_phase(s, e, n)
 
-            self.color_r[s:e] = np.where(magenta, 1.0, np.where(indigo, 0.29, cr_mod))
-            self.color_g[s:e] = np.where(magenta, 0.0, np.where(indigo, 0.0, cg_mod))
-            self.color_b[s:e] = np.where(magenta, 1.0, np.where(indigo, 0.51, cb_mod))
+        self.count = e
+
+    def _spawn_humanity(self, image_source):
+        """Humanity spawn: desaturate 50-80% toward luminance, boost
+        dark pixels, 3% magenta / 3% indigo accents — fused in
+        _humanity_colors."""
+        claimed = self._spawn_prologue(image_source)
+        if claimed is None:
+            return
+        n, s, e, cr, cg, cb = claimed
 
-            life_vals = np.random.uniform(2.5, 4.5, n).astype(np.float32)
+        self._fill_uniform(self.vel_x[s:e], -0.01, 0.01)
+        self._fill_uniform(self.vel_y[s:e], 0.005, 0.025)
 
-        self.life[s:e] = life_vals
-        self.max_life[s:e] = life_vals
-        self._phase[s:e] = np.random.uniform(0, 2 * np.pi, n).astype(np.float32)
+        desat = self._fill_uniform(self._scratch[0, :n], 0.5, 0.8)
+        roll = self._scratch[1, :n]
+        self._rng.random(out=roll, dtype=np.float32)
+        _humanity_colors(cr, cg, cb, desat, roll,
+                         self.color_r[s:e], self.color_g[s:e], self.color_b[s:e])
+
+        self._fill_uniform(self.life[s:e], 2.5, 4.5)
+        self.max_life[s:e] = self.life[s:e]
+        self._roll_wobble_phase(s, e, n)
 
         self.count = e
 
     def spawn_camera(self, brightness, motion, is_ember):
         """Legacy camera-based spawn for webcam mode."""
-        from camera import CAPTURE_W, CAPTURE_H
+        if _build_alias is None:
+            _resolve_camera_deps()
 
         slots = MAX_PARTICLES - self.count
         if slots <= 0:
@@ -102,53 +284,103 @@ class ParticleSystem:
 
         n = min(SPAWN_PER_FRAME, slots)
 
-        weights = brightness * 0.6 + motion * 0.4
-        flat = weights.ravel()
+        # Blend and normalize the spawn weights in a persistent
+        # workspace — no fresh arrays on the per-frame webcam path
+        if self._cam_weights is None or self._cam_weights.shape[1:] != brightness.shape:
+            self._cam_weights = np.empty((2,) + brightness.shape, dtype=np.float32)
+        w, m = self._cam_weights
+        np.multiply(brightness, 0.6, out=w)
+        np.multiply(motion, 0.4, out=m)
+        w += m
+        flat = w.ravel()
         total = flat.sum()
         if total < 1e-6:
             return
 
-        probs = flat / total
-        indices = np.random.choice(len(flat), size=n, replace=True, p=probs)
-
-        gy, gx = np.unravel_index(indices, (CAPTURE_H, CAPTURE_W))
-
-        # Map grid coords to NDC (-1..1), mirror x so webcam feels natural
-        nx = 1.0 - (gx.astype(np.float32) / CAPTURE_W) * 2.0
-        ny = 1.0 - (gy.astype(np.float32) / CAPTURE_H) * 2.0
-
-        nx += np.random.uniform(-1.0 / CAPTURE_W, 1.0 / CAPTURE_W, n).astype(np.float32)
-        ny += np.random.uniform(-1.0 / CAPTURE_H, 1.0 / CAPTURE_H, n).astype(np.float32)
+        # Alias-method draw (same kernels ImageSource uses): the table
+        # rebuild is O(grid) on the fresh per-frame weights, then each
+        # of the n samples is O(1) — np.random.choice with p= would
+        # redo a CDF build plus a binary search per sample instead.
+        flat /= total
+        q, j = _build_alias(flat)
+        u1 = self._scratch[0, :n]
+        self._rng.random(out=u1, dtype=np.float32)
+        u2 = self._scratch[1, :n]
+        self._rng.random(out=u2, dtype=np.float32)
+        indices = self._idx_buf[:n]
+        _alias_sample(q, j, u1, u2, indices)
+
+        gy, gx = np.unravel_index(indices, (_CAPTURE_H, _CAPTURE_W))
 
         s = self.count
         e = s + n
 
-        self.pos_x[s:e] = nx
-        self.pos_y[s:e] = ny
+        # Map grid coords to NDC (-1..1), mirror x so webcam feels
+        # natural — the int->float cast happens on assignment into the
+        # destination slices, so no astype temporaries
+        px = self.pos_x[s:e]
+        px[:] = gx
+        px *= np.float32(-2.0 / _CAPTURE_W)
+        px += 1.0
+        px += self._fill_uniform(
+            self._scratch[0, :n], -1.0 / _CAPTURE_W, 1.0 / _CAPTURE_W)
+        py = self.pos_y[s:e]
+        py[:] = gy
+        py *= np.float32(-2.0 / _CAPTURE_H)
+        py += 1.0
+        py += self._fill_uniform(
+            self._scratch[1, :n], -1.0 / _CAPTURE_H, 1.0 / _CAPTURE_H)
 
         if is_ember:
-            self.vel_x[s:e] = np.random.uniform(-0.15, 0.15, n).astype(np.float32)
-            self.vel_y[s:e] = np.random.uniform(0.05, 0.35, n).astype(np.float32)
-            t = np.random.uniform(0.0, 1.0, n).astype(np.float32)
-            spark = np.random.uniform(0.0, 1.0, n) < 0.1
-            self.color_r[s:e] = np.where(spark, 1.0, 1.0)
-            self.color_g[s:e] = np.where(spark, 1.0, 0.27 + t * 0.57)
-            self.color_b[s:e] = np.where(spark, 1.0, 0.0)
+            self._fill_uniform(self.vel_x[s:e], -0.15, 0.15)
+            self._fill_uniform(self.vel_y[s:e], 0.05, 0.35)
+            t = self._scratch[0, :n]
+            self._rng.random(out=t, dtype=np.float32)
+            roll = self._scratch[1, :n]
+            self._rng.random(out=roll, dtype=np.float32)
+            spark = np.less(roll, 0.1, out=self._mask_scratch[0, :n])
+            # Base gradient written in place, spark overrides scattered
+            # on top — no np.where temporaries
+            t *= 0.57
+            t += 0.27
+            self.color_r[s:e] = 1.0
+            g = self.color_g[s:e]
+            g[:] = t
+            g[spark] = 1.0
+            b = self.color_b[s:e]
+            b[:] = 0.0
+            b[spark] = 1.0
         else:
-            self.vel_x[s:e] = np.random.uniform(-0.03, 0.03, n).astype(np.float32)
-            self.vel_y[s:e] = np.random.uniform(0.01, 0.08, n).astype(np.float32)
-            roll = np.random.uniform(0.0, 1.0, n)
-            magenta = roll < 0.05
-            indigo = (roll >= 0.05) & (roll < 0.10)
-            gray_val = np.random.uniform(0.15, 0.4, n).astype(np.float32)
-            self.color_r[s:e] = np.where(magenta, 1.0, np.where(indigo, 0.29, gray_val))
-            self.color_g[s:e] = np.where(magenta, 0.0, np.where(indigo, 0.0, gray_val))
-            self.color_b[s:e] = np.where(magenta, 1.0, np.where(indigo, 0.51, gray_val))
-
-        life_vals = np.random.uniform(1.0, 3.0, n).astype(np.float32)
-        self.life[s:e] = life_vals
-        self.max_life[s:e] = life_vals
-        self._phase[s:e] = np.random.uniform(0, 2 * np.pi, n).astype(np.float32)
+            self._fill_uniform(self.vel_x[s:e], -0.03, 0.03)
+            self._fill_uniform(self.vel_y[s:e], 0.01, 0.08)
+            roll = self._scratch[0, :n]
+            self._rng.random(out=roll, dtype=np.float32)
+            magenta = np.less(roll, 0.05, out=self._mask_scratch[0, :n])
+            # roll < 0.10 xor roll < 0.05 leaves exactly the [0.05, 0.10) band
+            indigo = np.less(roll, 0.10, out=self._mask_scratch[1, :n])
+            np.logical_xor(indigo, magenta, out=indigo)
+            gray_val = self._fill_uniform(self._scratch[1, :n], 0.15, 0.4)
+            # Gray base in place, then tiny accent scatters — replaces
+            # two nested np.where passes per channel. Beats a
+            # digitize-plus-table np.take as well: the accent bands
+            # cover ~10% of rolls, so two sparse scatter writes touch
+            # far less than a full-vector gather would
+            r = self.color_r[s:e]
+            g = self.color_g[s:e]
+            b = self.color_b[s:e]
+            r[:] = gray_val
+            g[:] = gray_val
+            b[:] = gray_val
+            r[indigo] = 0.29
+            g[indigo] = 0.0
+            b[indigo] = 0.51
+            r[magenta] = 1.0
+            g[magenta] = 0.0
+            b[magenta] = 1.0
+
+        self._fill_uniform(self.life[s:e], 1.0, 3.0)
+        self.max_life[s:e] = self.life[s:e]
+        self._roll_wobble_phase(s, e, n)
 
         self.count = e
 
@@ -162,24 +394,33 @@ class ParticleSystem:
         s = self.count
         e = s + n
 
-        self.pos_x[s:e] = palm_ndc_x + np.random.uniform(-0.05, 0.05, n).astype(np.float32)
-        self.pos_y[s:e] = palm_ndc_y + np.random.uniform(-0.05, 0.05, n).astype(np.float32)
+        self._fill_uniform(self.pos_x[s:e], palm_ndc_x - 0.05, palm_ndc_x + 0.05)
+        self._fill_uniform(self.pos_y[s:e], palm_ndc_y - 0.05, palm_ndc_y + 0.05)
 
-        self.vel_x[s:e] = np.random.uniform(-0.10, 0.10, n).astype(np.float32)
-        self.vel_y[s:e] = np.random.uniform(0.15, 0.50, n).astype(np.float32)
+        self._fill_uniform(self.vel_x[s:e], -0.10, 0.10)
+        self._fill_uniform(self.vel_y[s:e], 0.15, 0.50)
 
         # Colors: orange #FF8C00 to gold #FFD700, 15% white-hot sparks
-        t = np.random.uniform(0.0, 1.0, n).astype(np.float32)
-        spark = np.random.uniform(0.0, 1.0, n) < 0.15
-        # Orange (1.0, 0.55, 0.0) -> Gold (1.0, 0.84, 0.0)
-        self.color_r[s:e] = np.where(spark, 1.0, 1.0)
-        self.color_g[s:e] = np.where(spark, 1.0, 0.55 + t * 0.29)
-        self.color_b[s:e] = np.where(spark, 0.9, 0.0)
-
-        life_vals = np.random.uniform(0.4, 1.2, n).astype(np.float32)
-        self.life[s:e] = life_vals
-        self.max_life[s:e] = life_vals
-        self._phase[s:e] = np.random.uniform(0, 2 * np.pi, n).astype(np.float32)
+        t = self._scratch[0, :n]
+        self._rng.random(out=t, dtype=np.float32)
+        roll = self._scratch[1, :n]
+        self._rng.random(out=roll, dtype=np.float32)
+        spark = np.less(roll, 0.15, out=self._mask_scratch[0, :n])
+        # Orange (1.0, 0.55, 0.0) -> Gold (1.0, 0.84, 0.0) base written
+        # in place, white-hot spark overrides scattered on top
+        t *= 0.29
+        t += 0.55
+        self.color_r[s:e] = 1.0
+        g = self.color_g[s:e]
+        g[:] = t
+        g[spark] = 1.0
+        b = self.color_b[s:e]
+        b[:] = 0.0
+        b[spark] = 0.9
+
+        self._fill_uniform(self.life[s:e], 0.4, 1.2)
+        self.max_life[s:e] = self.life[s:e]
+        self._roll_wobble_phase(s, e, n)
 
         self.count = e
 
@@ -188,23 +429,9 @@ class ParticleSystem:
             return
 
         n = self.count
-        dx = self.pos_x[:n] - palm_ndc_x
-        dy = self.pos_y[:n] - palm_ndc_y
-        dist = np.sqrt(dx * dx + dy * dy)
-
-        # Normalize distance: t = clamp(dist / 1.0, 0, 1)
-        t = np.clip(dist, 0.0, 1.0)
-
-        # Hermite interpolation on green channel: smooth fire gradient
-        # Near palm (t=0): yellow (1.0, 1.0, 0.0)
-        # Far from palm (t=1): deep red (1.0, 0.27, 0.0)
-        # g = 1.0 - 0.73 * (3t^2 - 2t^3)
-        hermite = 3.0 * t * t - 2.0 * t * t * t
-        g = 1.0 - 0.73 * hermite
-
-        self.color_r[:n] = 1.0
-        self.color_g[:n] = g.astype(np.float32)
-        self.color_b[:n] = 0.0
+        _fire_gradient(self.pos_x[:n], self.pos_y[:n],
+                       np.float32(palm_ndc_x), np.float32(palm_ndc_y),
+                       self.color_r[:n], self.color_g[:n], self.color_b[:n])
 
     def update(self, dt, is_ember=False):
         if self.count == 0:
@@ -213,49 +440,76 @@ class ParticleSystem:
         self._time += dt
         n = self.count
 
-        # Mode-dependent wobble amplitude
+        # Mode-dependent wobble amplitude; the fused kernel does the
+        # whole integrate-and-age pass and reports the dead count
         wobble_amp = 0.025 if is_ember else 0.012
-        wobble = np.sin(self._time * 2.0 + self._phase[:n]) * wobble_amp
-        self.pos_x[:n] += (self.vel_x[:n] + wobble) * dt
-        self.pos_y[:n] += self.vel_y[:n] * dt
-
-        self.life[:n] -= dt
-
-        # Compact: swap-and-pop dead particles
-        alive = self.life[:n] > 0.0
-        dead_count = n - int(alive.sum())
-        if dead_count > 0:
-            alive_idx = np.where(alive)[0]
+        st = math.sin(self._time * 2.0)
+        ct = math.cos(self._time * 2.0)
+        dead_count = _update_kernel(
+            self.pos_x[:n], self.pos_y[:n], self.vel_x[:n], self.vel_y[:n],
+            self.life[:n], self._sph[:n], self._cph[:n],
+            np.float32(st), np.float32(ct), np.float32(wobble_amp),
+            np.float32(dt))
+
+        # Amortized compaction: a dead particle costs nothing to keep —
+        # its clamped life ratio packs to 0, so the shader draws it at
+        # zero alpha — while compacting costs a gather over the whole
+        # field block. Let dead particles accumulate until they're worth
+        # evicting in one batch; the only price is that their slots stay
+        # unavailable to spawn until then.
+        if dead_count > max(256, n >> 3):
+            # One fancy-index over the consolidated (field, particle)
+            # block moves every surviving field in a single pass — not
+            # ten per-array gathers
+            alive_idx = np.where(self.life[:n] > 0.0)[0]
             new_count = len(alive_idx)
-
-            for arr in (self.pos_x, self.pos_y, self.vel_x, self.vel_y,
-                        self.life, self.max_life, self.color_r, self.color_g,
-                        self.color_b, self._phase):
-                arr[:new_count] = arr[alive_idx]
-
+            self._data[:, :new_count] = self._data[:, alive_idx]
             self.count = new_count
 
     def pack_gpu(self):
+        """Pack the live particles for upload and return a C-contiguous
+        view into the reused scratch buffer — callers pass it straight
+        to Buffer.write (buffer protocol, no tobytes copy; only the
+        live n * GPU_DTYPE.itemsize bytes travel) and must consume it
+        before the next pack_gpu call.
+
+        Packing stays a separate pass rather than fused into the
+        update kernel: Numba can't emit the f16 position narrowing, and
+        keeping quantization here means the sim tick never needs to
+        know the upload format. At 8 bytes per particle the whole pack
+        is ~200 KB of traffic per frame at MAX_PARTICLES — not worth
+        coupling the two stages over.
+        """
         n = self.count
         if n == 0:
-            return np.empty(0, dtype=np.float32)
-
-        ratio = self.life[:n] / self.max_life[:n]
-
-        # Brief fade-in: peak at 85% remaining life, then fade out
-        # ratio=1.0 (just born) -> fade in; ratio=0.85 -> peak; ratio=0.0 -> dead
-        alpha = np.where(ratio > 0.85, (1.0 - ratio) / 0.15, ratio / 0.85)
-        alpha = np.clip(alpha, 0.0, 1.0)
-
-        size = 1.5 + ratio * 4.0
-
-        buf = np.empty(n * 7, dtype=np.float32)
-        buf[0::7] = self.pos_x[:n]
-        buf[1::7] = self.pos_y[:n]
-        buf[2::7] = self.color_r[:n]
-        buf[3::7] = self.color_g[:n]
-        buf[4::7] = self.color_b[:n]
-        buf[5::7] = alpha
-        buf[6::7] = size
-
-        return buf
+            return np.empty(0, dtype=GPU_DTYPE)
+
+        # Quantize into the preallocated packed buffer: positions narrow
+        # to f16, colors and the life ratio to normalized uint8. The
+        # fade-in/fade-out alpha curve and the size ramp live in the
+        # vertex shader now — the GPU evaluates them from the ratio.
+        # Field writes are strided across the 8-byte records, but each
+        # cache line holds 8 whole vertices, so a line is touched a few
+        # times while hot instead of the write-combine thrash of the old
+        # 28-byte interleaved-float layout.
+        out = self._gpu_buf[:n]
+        out["pos"][:, 0] = self.pos_x[:n]
+        out["pos"][:, 1] = self.pos_y[:n]
+        # Color quantization staged through the one f32 scratch row —
+        # np.multiply with out= instead of a fresh temporary per channel
+        tmp = self._ratio_buf[:n]
+        np.multiply(self.color_r[:n], 255.0, out=tmp)
+        out["color"][:, 0] = tmp
+        np.multiply(self.color_g[:n], 255.0, out=tmp)
+        out["color"][:, 1] = tmp
+        np.multiply(self.color_b[:n], 255.0, out=tmp)
+        out["color"][:, 2] = tmp
+        # Divide/clamp/scale chained in place through the reused f32
+        # scratch row — no fresh temporary per pack
+        ratio = self._ratio_buf[:n]
+        np.divide(self.life[:n], self.max_life[:n], out=ratio)
+        np.clip(ratio, 0.0, 1.0, out=ratio)
+        ratio *= 255.0
+        out["ratio"] = ratio
+
+        return out
@@ -2,13 +2,18 @@
 
 layout(location = 0) in vec2 in_pos;
 layout(location = 1) in vec3 in_color;
-layout(location = 2) in float in_alpha;
-layout(location = 3) in float in_size;
+layout(location = 2) in float in_ratio;
 
 out vec4 v_color;
 
 void main() {
     gl_Position = vec4(in_pos, 0.0, 1.0);
-    gl_PointSize = in_size;
-    v_color = vec4(in_color, in_alpha);
+
+    // Life ratio drives size and alpha on the GPU:
+    // ratio=1.0 (just born) -> fade in; 0.85 -> peak; 0.0 -> dead
+    gl_PointSize = 1.5 + in_ratio * 4.0;
+    float alpha = in_ratio > 0.85
+        ? (1.0 - in_ratio) / 0.15
+        : in_ratio / 0.85;
+    v_color = vec4(in_color, clamp(alpha, 0.0, 1.0));
 }
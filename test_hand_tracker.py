@@ -25,7 +25,7 @@ HAND_CONNECTIONS = [
 ]
 
 FINGERTIPS = {4, 8, 12, 16, 20}
-FINGER_TIP_TO_NAME = {4: "thumb", 8: "index", 12: "middle", 16: "ring", 20: "pinky"}
+FINGER_TIP_TO_IDX = {4: 0, 8: 1, 12: 2, 16: 3, 20: 4}
 
 # Colors (BGR)
 COLOR_OPEN = (0, 255, 0)
@@ -67,11 +67,9 @@ def draw_hand_overlay(frame, hand_data, tracker):
         cv2.line(frame, pts[a], pts[b], COLOR_BONE, 2)
 
     # Draw joints
-    finger_states = hand_data.finger_states or {}
     for i, (px, py) in enumerate(pts):
         if i in FINGERTIPS:
-            fname = FINGER_TIP_TO_NAME[i]
-            extended = finger_states.get(fname, False)
+            extended = hand_data.finger_state(FINGER_TIP_TO_IDX[i])
             color = COLOR_OPEN if extended else COLOR_CLOSED
             cv2.circle(frame, (px, py), 7, color, -1)
             cv2.circle(frame, (px, py), 7, (255, 255, 255), 1)
@@ -109,8 +107,8 @@ def draw_hand_overlay(frame, hand_data, tracker):
 
     # Per-finger status
     y_off = 70
-    for fname in ["thumb", "index", "middle", "ring", "pinky"]:
-        extended = finger_states.get(fname, False)
+    for fi, fname in enumerate(["thumb", "index", "middle", "ring", "pinky"]):
+        extended = hand_data.finger_state(fi)
         color = COLOR_OPEN if extended else COLOR_CLOSED
         marker = "[X]" if extended else "[ ]"
         cv2.putText(frame, f"{marker} {fname}", (15, y_off),